@@ -0,0 +1,70 @@
+"""
+In-process caching utilities
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a time-to-live"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a live entry, or default if missing or expired"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            value, expires_at = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store an entry, evicting the least recently used one when full"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove an entry and return its value"""
+        with self._lock:
+            item = self._data.pop(key, None)
+        return default if item is None else item[0]
+    
+    def pop_where(self, predicate: Callable[[Any], bool]) -> None:
+        """Remove every entry whose value matches predicate"""
+        with self._lock:
+            for key in [k for k, (v, _) in self._data.items() if predicate(v)]:
+                del self._data[key]
+    
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+
+# Storefront reference data, read on every page load and changed only from the
+# admin panel. Entries hold rendered JSON bodies. Caches are per process: an
+# admin write clears only the worker that handled it, and the other workers
+# keep serving the old body until their entry expires, so the TTL is the
+# staleness bound after an edit and is kept short.
+banners_cache = TTLCache(maxsize=1, ttl=30)
+categories_cache = TTLCache(maxsize=256, ttl=30)
+settings_cache = TTLCache(maxsize=1, ttl=30)
+pages_cache = TTLCache(maxsize=64, ttl=30)
+
+# Carrier tracking responses, keyed by AWB. Customers refreshing a tracking page
+# are served from here instead of re-hitting the Delhivery API.
+tracking_cache = TTLCache(maxsize=1024, ttl=60)
@@ -13,11 +13,14 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api"
     ENVIRONMENT: str = "development"
     PORT: int = 8000
+    THREADPOOL_SIZE: int = 64  # Worker threads for sync (DB-bound) endpoints
+    WEB_CONCURRENCY: Optional[int] = None  # Server processes, defaults to CPU count
     
     # Security
     JWT_SECRET: str = "bharatbazaar-secret-key-2024"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_DAYS: int = 7
+    BCRYPT_ROUNDS: int = 10  # Work factor for newly hashed passwords
     
     # Database
     DB_USER: Optional[str] = None
@@ -26,6 +29,11 @@ class Settings(BaseSettings):
     DB_PORT: Optional[str] = None
     DB_NAME: Optional[str] = None
     USE_SQLITE: bool = True
+    DB_INSERT_PAGE_SIZE: int = 1000  # Rows per multi-row INSERT for executemany
+    DB_POOL_SIZE: int = 20  # Persistent connections per worker process
+    DB_MAX_OVERFLOW: int = 40  # Extra connections allowed under burst load
+    DB_POOL_RECYCLE: int = 3600  # Seconds before a connection is replaced (below MySQL wait_timeout)
+    DB_POOL_TIMEOUT: int = 10  # Seconds to wait for a free connection before failing the request
     
     # CORS
     ALLOWED_HOSTS: List[str] = ["*"]
@@ -61,7 +69,9 @@ class Settings(BaseSettings):
     
     # File Upload
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
+    MAX_VIDEO_SIZE: int = 50 * 1024 * 1024  # 50MB, for return evidence videos
     ALLOWED_IMAGE_TYPES: List[str] = ["image/jpeg", "image/png", "image/webp"]
+    SERVE_UPLOADS: bool = True  # Set False when a reverse proxy serves /uploads
     
     @property
     def database_url(self) -> str:
@@ -1,19 +1,28 @@
 """
 Database Configuration
 """
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from typing import List, Dict, Any
+from sqlalchemy import create_engine, select, tuple_
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 from .config import settings
 
 # Create database engine
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,
+    # Sized for THREADPOOL_SIZE concurrent sync endpoints, each holding a session
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    # executemany INSERTs are sent as batched multi-row VALUES statements
+    insertmanyvalues_page_size=settings.DB_INSERT_PAGE_SIZE,
     connect_args=settings.database_connect_args
 )
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Committed objects keep their loaded state instead of re-SELECTing on next access
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # Create base class for models
 Base = declarative_base()
@@ -24,4 +33,46 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def upsert(db: Session, model, rows: List[Dict[str, Any]], index_elements: List[str], update_columns: List[str]) -> None:
+    """Insert rows in one statement, updating update_columns where index_elements already exist"""
+    if not rows:
+        return
+    
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+        stmt = insert(model)
+        stmt = stmt.on_duplicate_key_update({c: stmt.inserted[c] for c in update_columns})
+    elif dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        stmt = insert(model)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={c: stmt.excluded[c] for c in update_columns}
+        )
+    else:
+        # No native upsert: one keyed SELECT, then one bulk UPDATE and one bulk INSERT
+        pk = model.__mapper__.primary_key[0].name
+        key_cols = [getattr(model, c) for c in index_elements]
+        keys = [tuple(row[c] for c in index_elements) for row in rows]
+        existing = {
+            tuple(r[1:]): r[0]
+            for r in db.execute(select(getattr(model, pk), *key_cols).where(tuple_(*key_cols).in_(keys)))
+        }
+        to_update = [
+            {pk: existing[key], **{c: row[c] for c in update_columns}}
+            for key, row in zip(keys, rows) if key in existing
+        ]
+        to_insert = [row for key, row in zip(keys, rows) if key not in existing]
+        if to_update:
+            db.bulk_update_mappings(model, to_update)
+        if to_insert:
+            db.bulk_insert_mappings(model, to_insert)
+        return
+    
+    db.execute(stmt, rows)
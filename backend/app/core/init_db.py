@@ -2,23 +2,44 @@
 Database initialization
 """
 import logging
+from contextlib import contextmanager
+from sqlalchemy import text
 from sqlalchemy.orm import Session
-from .database import SessionLocal
-from .security import hash_password
+from .database import SessionLocal, engine
+from .security import hash_password, verify_password
 from app import models
 from app.core.utils import generate_id
 
 logger = logging.getLogger(__name__)
 
+@contextmanager
+def init_lock():
+    """Serialize initialization across server workers where the database allows it"""
+    if engine.dialect.name != "mysql":
+        # SQLite serializes writers itself and users.phone is unique
+        yield
+        return
+    
+    # Named locks belong to a connection, so hold one open for the whole run
+    with engine.connect() as conn:
+        conn.execute(text("SELECT GET_LOCK('bharatbazaar_init_db', 60)"))
+        try:
+            yield
+        finally:
+            conn.execute(text("SELECT RELEASE_LOCK('bharatbazaar_init_db')"))
+
 def init_db() -> None:
-    """Initialize database with default data"""
-    db = SessionLocal()
-    try:
-        create_initial_admin(db)
-    except Exception as e:
-        logger.error(f"Error initializing database: {e}")
-    finally:
-        db.close()
+    """Create tables and default data; safe to run from every worker"""
+    with init_lock():
+        models.Base.metadata.create_all(bind=engine)
+        
+        db = SessionLocal()
+        try:
+            create_initial_admin(db)
+        except Exception as e:
+            logger.error(f"Error initializing database: {e}")
+        finally:
+            db.close()
 
 def create_initial_admin(db: Session) -> None:
     """Create initial admin user"""
@@ -40,9 +61,11 @@ def create_initial_admin(db: Session) -> None:
         db.commit()
         logger.info(f"Admin user {admin_phone} created.")
     else:
-        # Update password to ensure it's correct
-        admin.password = hash_password("Rohit@123")
+        # Update password to ensure it's correct; only re-hash when it no longer matches
+        if not admin.password or not verify_password("Rohit@123", admin.password):
+            admin.password = hash_password("Rohit@123")
         admin.role = "admin"
         admin.name = "Rohit"
-        db.commit()
+        if db.is_modified(admin):
+            db.commit()
         logger.info(f"Admin user {admin_phone} updated/verified.")
\ No newline at end of file
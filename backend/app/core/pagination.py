@@ -0,0 +1,36 @@
+"""
+Keyset (cursor) pagination over (created_at, id), newest first
+"""
+import base64
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from fastapi import HTTPException
+from sqlalchemy import and_, desc, or_
+from sqlalchemy.orm import Query
+
+def encode_cursor(row: Any) -> str:
+    """Opaque cursor pointing just past row"""
+    raw = f"{row.created_at.isoformat()}|{row.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Split a cursor back into (created_at, id)"""
+    try:
+        created_at, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), row_id
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def keyset_page(query: Query, model: Any, cursor: Optional[str], limit: int) -> Tuple[List[Any], Optional[str]]:
+    """Fetch one page after cursor and the cursor for the next one, without COUNT or OFFSET"""
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            model.created_at < created_at,
+            and_(model.created_at == created_at, model.id < row_id)
+        ))
+    
+    # One extra row tells us whether another page exists
+    rows = query.order_by(desc(model.created_at), desc(model.id)).limit(limit + 1).all()
+    next_cursor = encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+    return rows[:limit], next_cursor
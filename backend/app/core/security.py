@@ -1,34 +1,55 @@
 """
 Security utilities for authentication and authorization
 """
+import os
+import copy
+import time
+import hashlib
 import jwt
 import bcrypt
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Optional, Dict, Any
 from fastapi import HTTPException, Depends, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
+from .cache import TTLCache
 from .config import settings
 from .database import get_db
 from app import models
 
 security = HTTPBearer()
 
+# Successful bcrypt checks, keyed on a keyed digest of the password plus the
+# stored hash. The key is random per process, so cached digests are useless
+# outside it; a password change produces a new hash and so a new cache key.
+_VERIFY_KEY = os.urandom(32)
+_verified_passwords = TTLCache(maxsize=4096, ttl=15 * 60)
+
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt"""
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)).decode()
 
 def verify_password(password: str, hashed: str) -> bool:
     """Verify a password against its hash"""
-    return bcrypt.checkpw(password.encode(), hashed.encode())
+    key = (hashlib.blake2b(password.encode(), key=_VERIFY_KEY).digest(), hashed)
+    if _verified_passwords.get(key):
+        return True
+    
+    if not bcrypt.checkpw(password.encode(), hashed.encode()):
+        return False
+    _verified_passwords.set(key, True)
+    return True
+
+_TOKEN_LIFETIME = int(timedelta(days=settings.ACCESS_TOKEN_EXPIRE_DAYS).total_seconds())
 
 def create_access_token(user_id: str, role: str) -> str:
     """Create JWT access token"""
     payload = {
         "user_id": user_id,
         "role": role,
-        "exp": datetime.now(timezone.utc) + timedelta(days=settings.ACCESS_TOKEN_EXPIRE_DAYS)
+        # Integer epoch seconds: what PyJWT encodes anyway, without building datetimes
+        "exp": int(time.time()) + _TOKEN_LIFETIME
     }
     return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
 
@@ -42,6 +63,56 @@ def decode_token(token: str) -> Dict[str, Any]:
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+# Public user columns, resolved once instead of walking __table__ per request
+USER_COLUMNS = tuple(c.name for c in models.User.__table__.columns if c.name != "password")
+
+def user_to_dict(user: models.User) -> Dict[str, Any]:
+    """Public fields of a user, read from loaded instance state where possible"""
+    state = user.__dict__
+    return {k: state[k] if k in state else getattr(user, k) for k in USER_COLUMNS}
+
+# Resolved users by token digest. Entries live at most 60s (10s for admins)
+# and never past the token's own expiry; invalidate_user() drops them when a
+# user record changes. The cache is per process, see invalidate_user().
+_token_users = TTLCache(maxsize=10000, ttl=60)
+_ADMIN_TOKEN_TTL = 10
+
+def user_from_token(token: str, db: Session) -> Optional[Dict[str, Any]]:
+    """Resolve a bearer token to its user dict, or None if the user is gone"""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_users.get(key)
+    if cached is not None:
+        # Deep copy: handlers may mutate nested fields such as addresses
+        return copy.deepcopy(cached)
+    
+    payload = decode_token(token)
+    user = db.query(models.User).filter(models.User.id == payload["user_id"]).first()
+    if not user:
+        return None
+    
+    # Convert to dict for backward compatibility
+    user_dict = user_to_dict(user)
+    if user.address is None: 
+        user_dict["address"] = None
+    if user.addresses is None: 
+        user_dict["addresses"] = []
+    
+    # Admin rights are the costliest to keep honouring after a role change
+    max_ttl = _ADMIN_TOKEN_TTL if user_dict.get("role") == "admin" else _token_users.ttl
+    ttl = min(max_ttl, payload["exp"] - time.time())
+    if ttl > 0:
+        _token_users.set(key, copy.deepcopy(user_dict), ttl)
+    return user_dict
+
+def invalidate_user(user_id: str) -> None:
+    """Forget cached token lookups for a user after their record changes.
+    
+    Only this worker's cache is cleared. Other worker processes keep serving
+    the old user dict (role, is_active) until their entry expires: up to 60s,
+    or 10s for admin tokens.
+    """
+    _token_users.pop_where(lambda user_dict: user_dict["id"] == user_id)
+
 def get_current_user_optional(request: Request, db: Session = Depends(get_db)) -> Optional[Dict[str, Any]]:
     """Optional authentication - returns None if no token provided"""
     authorization = request.headers.get("Authorization")
@@ -53,19 +124,7 @@ def get_current_user_optional(request: Request, db: Session = Depends(get_db)) -
         if scheme.lower() != "bearer":
             return None
         
-        payload = decode_token(token)
-        user = db.query(models.User).filter(models.User.id == payload["user_id"]).first()
-        if not user:
-            return None
-        
-        # Convert to dict for backward compatibility
-        user_dict = {c.name: getattr(user, c.name) for c in user.__table__.columns}
-        user_dict.pop("password", None)
-        if user.address is None: 
-            user_dict["address"] = None
-        if user.addresses is None: 
-            user_dict["addresses"] = []
-        return user_dict
+        return user_from_token(token, db)
     except:
         return None
 
@@ -75,18 +134,9 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
         raise HTTPException(status_code=401, detail="No authorization header")
     
     try:
-        payload = decode_token(credentials.credentials)
-        user = db.query(models.User).filter(models.User.id == payload["user_id"]).first()
-        if not user:
+        user_dict = user_from_token(credentials.credentials, db)
+        if not user_dict:
             raise HTTPException(status_code=401, detail="User not found")
-        
-        # Convert to dict for backward compatibility
-        user_dict = {c.name: getattr(user, c.name) for c in user.__table__.columns}
-        user_dict.pop("password", None)
-        if user.address is None: 
-            user_dict["address"] = None
-        if user.addresses is None: 
-            user_dict["addresses"] = []
         return user_dict
     except HTTPException:
         raise
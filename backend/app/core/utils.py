@@ -3,7 +3,6 @@ Utility functions
 """
 import uuid
 import random
-import string
 from datetime import datetime
 from typing import Optional
 
@@ -14,15 +13,13 @@ def generate_id() -> str:
 def generate_order_number() -> str:
     """Generate a unique order number"""
     timestamp = datetime.now().strftime("%y%m%d")
-    random_part = ''.join(random.choices(string.digits, k=4))
-    return f"ORD{timestamp}{random_part}"
+    return f"ORD{timestamp}{random.randrange(10000):04d}"
 
 def generate_invoice_number() -> str:
     """Generate a unique invoice number"""
     timestamp = datetime.now().strftime("%y%m%d")
-    random_part = ''.join(random.choices(string.digits, k=4))
-    return f"INV{timestamp}{random_part}"
+    return f"INV{timestamp}{random.randrange(10000):04d}"
 
 def generate_otp() -> str:
     """Generate a 6-digit OTP"""
-    return str(random.randint(100000, 999999))
\ No newline at end of file
+    return str(random.randrange(100000, 1000000))
\ No newline at end of file
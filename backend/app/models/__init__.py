@@ -5,7 +5,7 @@ Re-exports all models for easy importing
 from app.core.database import Base
 from app.models.user import User, OTP
 from app.models.product import Product, Category
-from app.models.order import Order, ReturnRequest, OrderCancellation
+from app.models.order import Order, TrackingHistory, ReturnRequest, OrderCancellation
 from app.models.warehouse import InventoryLog
 from app.models.notification import Notification
 from app.models.seller import SellerRequest
@@ -24,6 +24,7 @@ __all__ = [
     "Product",
     "Category",
     "Order",
+    "TrackingHistory",
     "ReturnRequest",
     "OrderCancellation",
     "InventoryLog",
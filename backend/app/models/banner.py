@@ -1,7 +1,7 @@
 """
 Banner Model
 """
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, Index, text
 from datetime import datetime
 
 from app.core.database import Base
@@ -18,3 +18,13 @@ class Banner(Base):
     position = Column(Integer, default=0)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    
+    # The homepage reads active banners ordered by position
+    __table_args__ = (
+        Index(
+            "ix_banners_active_position", "position",
+            sqlite_where=text("is_active = 1"),
+            postgresql_where=text("is_active = true"),
+        ).ddl_if(dialect=("sqlite", "postgresql")),
+        Index("ix_banners_active_position", "is_active", "position").ddl_if(dialect="mysql"),
+    )
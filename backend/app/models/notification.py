@@ -1,7 +1,7 @@
 """
 Notification Model
 """
-from sqlalchemy import Column, String, Boolean, ForeignKey, DateTime, Text, JSON
+from sqlalchemy import Column, String, Boolean, ForeignKey, DateTime, Text, JSON, Index, text
 from datetime import datetime
 
 from app.core.database import Base
@@ -20,3 +20,23 @@ class Notification(Base):
     for_admin = Column(Boolean, default=False)
     read = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+    
+    # Lists and unread counts filter on (user_id, for_admin, read) and sort by
+    # created_at; these serve both as range scans without touching the table
+    __table_args__ = (
+        Index("ix_notifications_user_read_created", "user_id", "for_admin", "read", "created_at"),
+        Index("ix_notifications_admin_read_created", "for_admin", "read", "created_at"),
+        # Unread rows are a small live set next to the read history; partial
+        # indexes over just those keep badge counts tiny. MySQL has no
+        # partial indexes, so there the composites above cover it.
+        Index(
+            "ix_notifications_user_unread", "user_id", "created_at",
+            sqlite_where=text("read = 0 AND for_admin = 0"),
+            postgresql_where=text("read = false AND for_admin = false"),
+        ).ddl_if(dialect=("sqlite", "postgresql")),
+        Index(
+            "ix_notifications_admin_unread", "created_at",
+            sqlite_where=text("read = 0 AND for_admin = 1"),
+            postgresql_where=text("read = false AND for_admin = true"),
+        ).ddl_if(dialect=("sqlite", "postgresql")),
+    )
@@ -1,7 +1,7 @@
 """
 Order, Return, and Cancellation Models
 """
-from sqlalchemy import Column, String, Float, Boolean, ForeignKey, DateTime, Text, JSON
+from sqlalchemy import Column, String, Float, Boolean, ForeignKey, DateTime, Text, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -35,13 +35,37 @@ class Order(Base):
     tracking_number = Column(String(50), nullable=True)
     courier_provider = Column(String(50), nullable=True)
     
-    tracking_history = Column(JSON, default=list)
+    tracking_history = Column(JSON, default=list)  # Legacy entries; new ones go to TrackingHistory
     notes = Column(JSON, default=list)
     
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow)
 
     user = relationship("User", back_populates="orders")
+    
+    # Order lists page newest first by (created_at, id): all orders or per
+    # status for admins, per user for customers
+    __table_args__ = (
+        Index("ix_orders_created_id", "created_at", "id"),
+        Index("ix_orders_status_created_id", "status", "created_at", "id"),
+        Index("ix_orders_user_created", "user_id", "created_at"),
+    )
+
+
+class TrackingHistory(Base):
+    __tablename__ = "tracking_history"
+    
+    id = Column(String(36), primary_key=True, default=generate_id)
+    order_id = Column(String(36), ForeignKey("orders.id"), nullable=False)
+    status = Column(String(20))
+    timestamp = Column(DateTime, default=datetime.utcnow)
+    notes = Column(Text, nullable=True)
+    updated_by = Column(String(100), nullable=True)
+    
+    # One row per status change instead of rewriting a growing JSON list
+    __table_args__ = (
+        Index("ix_tracking_history_order_timestamp", "order_id", "timestamp"),
+    )
 
 
 class ReturnRequest(Base):
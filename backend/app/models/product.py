@@ -1,7 +1,7 @@
 """
 Product and Category Models
 """
-from sqlalchemy import Column, String, Integer, Float, Boolean, ForeignKey, DateTime, Text, JSON
+from sqlalchemy import Column, String, Integer, Float, Boolean, ForeignKey, DateTime, Text, JSON, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -24,6 +24,16 @@ class Category(Base):
     products = relationship("Product", back_populates="category")
     parent = relationship("Category", remote_side=[id], backref="children")
     
+    # Public listings only read active categories, optionally by parent
+    __table_args__ = (
+        Index(
+            "ix_categories_active_parent", "parent_id",
+            sqlite_where=text("is_active = 1"),
+            postgresql_where=text("is_active = true"),
+        ).ddl_if(dialect=("sqlite", "postgresql")),
+        Index("ix_categories_active_parent", "is_active", "parent_id").ddl_if(dialect="mysql"),
+    )
+    
     @property
     def level(self):
         """Calculate the depth level of this category"""
@@ -100,3 +110,26 @@ class Product(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     category = relationship("Category", back_populates="products")
+    
+    __table_args__ = (
+        # Word/prefix search for /products?search= on MySQL; a leading-wildcard
+        # LIKE can't use a b-tree index and scans every product
+        Index("ix_products_search", "name", "description", "sku", mysql_prefix="FULLTEXT").ddl_if(dialect="mysql"),
+        # Storefront listing: active products by category, newest first.
+        # Partial where supported; MySQL leads a composite with is_active.
+        Index(
+            "ix_products_active_category_created", "category_id", "created_at",
+            sqlite_where=text("is_active = 1"),
+            postgresql_where=text("is_active = true"),
+        ).ddl_if(dialect=("sqlite", "postgresql")),
+        Index(
+            "ix_products_active_category_created", "is_active", "category_id", "created_at",
+        ).ddl_if(dialect="mysql"),
+        # Low-stock inventory filter compares two columns, which only a partial
+        # index can serve; MySQL has none, and the table is small enough to scan
+        Index(
+            "ix_products_low_stock", "stock_qty",
+            sqlite_where=text("stock_qty <= low_stock_threshold"),
+            postgresql_where=text("stock_qty <= low_stock_threshold"),
+        ).ddl_if(dialect=("sqlite", "postgresql")),
+    )
@@ -39,7 +39,7 @@ class OTP(Base):
     __tablename__ = "otps"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    phone = Column(String(15), index=True)
+    phone = Column(String(15), unique=True, index=True)
     otp = Column(String(6))
     expiry = Column(DateTime)
     verified = Column(Boolean, default=False)
@@ -1,15 +1,22 @@
 """
 Admin endpoints - Complete CRUD operations for all admin resources
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_, desc
+from sqlalchemy import func, and_, or_, case, desc, exists, insert, select
+from sqlalchemy.exc import IntegrityError
 from typing import Optional, List
 from datetime import datetime, timedelta
 from pydantic import BaseModel
 
-from app.core.database import get_db
-from app.core.security import admin_required
+from app.core.cache import banners_cache, categories_cache, pages_cache
+from app.core.database import get_db, upsert
+from app.core.pagination import keyset_page
+from app.core.security import USER_COLUMNS, admin_required, invalidate_user, user_to_dict
+from app.core.utils import generate_id
+from app.routers.orders import order_detail
+from app.services.notification_service import NotificationService
 from app import models
 
 router = APIRouter()
@@ -105,31 +112,37 @@ class OfferCreate(BaseModel):
 def admin_dashboard(admin: dict = Depends(admin_required), db: Session = Depends(get_db)):
     """Admin dashboard statistics"""
     # Get today's sales
-    today = datetime.now().date()
-    today_orders_query = db.query(models.Order).filter(
-        func.date(models.Order.created_at) == today
-    ).all()
-    today_revenue = sum(order.grand_total for order in today_orders_query)
-    
-    # Total statistics
-    total_products = db.query(models.Product).count()
-    total_orders = db.query(models.Order).count()
-    total_customers = db.query(models.User).filter(models.User.role == "customer").count()
-    
-    pending_orders_count = db.query(models.Order).filter(
-        models.Order.status.in_(["pending", "processing"])
-    ).count()
-    
-    pending_returns_count = db.query(models.ReturnRequest).filter(
-        models.ReturnRequest.status == "pending"
-    ).count()
+    # Summed in SQL over a created_at range, which (unlike DATE(created_at))
+    # can use an index on created_at
+    today_start = datetime.combine(datetime.now().date(), datetime.min.time())
+    today_revenue, today_order_count = db.query(
+        func.coalesce(func.sum(models.Order.grand_total), 0),
+        func.count(models.Order.id)
+    ).filter(
+        models.Order.created_at >= today_start,
+        models.Order.created_at < today_start + timedelta(days=1)
+    ).one()
+    
+    # Order totals from one GROUP BY status
+    status_counts = dict(
+        db.query(models.Order.status, func.count(models.Order.id)).group_by(models.Order.status).all()
+    )
+    total_orders = sum(status_counts.values())
+    pending_orders_count = status_counts.get("pending", 0) + status_counts.get("processing", 0)
+    
+    # Product, customer and return counts in one round trip
+    low_stock_filter = models.Product.stock_qty <= models.Product.low_stock_threshold
+    total_products, low_stock_count, total_customers, pending_returns_count = db.query(
+        func.count(models.Product.id),
+        func.coalesce(func.sum(case((low_stock_filter, 1), else_=0)), 0),
+        db.query(func.count(models.User.id)).filter(models.User.role == "customer").scalar_subquery(),
+        db.query(func.count(models.ReturnRequest.id)).filter(
+            models.ReturnRequest.status == "pending"
+        ).scalar_subquery()
+    ).one()
     
     # Low stock
-    low_stock_query = db.query(models.Product).filter(
-        models.Product.stock_qty <= models.Product.low_stock_threshold
-    )
-    low_stock_count = low_stock_query.count()
-    low_stock_items = low_stock_query.limit(5).all()
+    low_stock_items = db.query(models.Product).filter(low_stock_filter).limit(5).all()
     
     # Recent orders
     recent_orders = db.query(models.Order).order_by(
@@ -139,7 +152,7 @@ def admin_dashboard(admin: dict = Depends(admin_required), db: Session = Depends
     return {
         "today": {
             "revenue": float(today_revenue),
-            "orders": len(today_orders_query)
+            "orders": today_order_count
         },
         "totals": {
             "products": total_products,
@@ -148,7 +161,7 @@ def admin_dashboard(admin: dict = Depends(admin_required), db: Session = Depends
         },
         "pending": {
             "orders": pending_orders_count,
-            "low_stock": low_stock_count,
+            "low_stock": int(low_stock_count),
             "returns": pending_returns_count
         },
         "recent_orders": recent_orders,
@@ -156,6 +169,216 @@ def admin_dashboard(admin: dict = Depends(admin_required), db: Session = Depends
         "admin": admin["name"]
     }
 
+# =============== Sample Data ===============
+
+# Sample images are Unsplash photos referenced by photo id
+_product_image = "https://images.unsplash.com/photo-{}?w=500".format
+_banner_image = "https://images.unsplash.com/photo-{}?w=1200&h=400&fit=crop".format
+
+# Static seed data, built once at import. Category ids are only known at
+# request time, so products and banners reference their category by name.
+_SAMPLE_CATEGORIES = (
+    {"name": "Electronics", "description": "Mobiles, audio and accessories"},
+    {"name": "Fashion", "description": "Clothing, footwear and accessories"},
+    {"name": "Home & Kitchen", "description": "Essentials for every home"},
+)
+
+_SAMPLE_PRODUCTS = (
+    ("Electronics", {
+        "name": "Wireless Bluetooth Headphones",
+        "description": "Over-ear headphones with noise cancellation and 20 hour battery",
+        "sku": "SAMPLE-HDN-001",
+        "mrp": 4999,
+        "selling_price": 3499,
+        "wholesale_price": 2999,
+        "cost_price": 2500,
+        "stock_qty": 50,
+        "gst_rate": 18.0,
+        "hsn_code": "8518",
+        "images": [_product_image("1505740420928-5e560c06d30e")],
+    }),
+    ("Electronics", {
+        "name": "Smart Fitness Watch",
+        "description": "Heart rate, SpO2 and sleep tracking with 7 day battery",
+        "sku": "SAMPLE-WCH-001",
+        "mrp": 5999,
+        "selling_price": 3999,
+        "wholesale_price": 3499,
+        "cost_price": 2800,
+        "stock_qty": 40,
+        "gst_rate": 18.0,
+        "hsn_code": "8517",
+        "images": [_product_image("1523275335684-37898b6baf30")],
+    }),
+    ("Fashion", {
+        "name": "Premium Cotton T-Shirt",
+        "description": "Comfortable 100% cotton t-shirt for everyday wear",
+        "sku": "SAMPLE-TSH-001",
+        "mrp": 799,
+        "selling_price": 499,
+        "wholesale_price": 399,
+        "cost_price": 250,
+        "stock_qty": 200,
+        "gst_rate": 5.0,
+        "hsn_code": "6109",
+        "images": [_product_image("1521572163474-6864f9cf17ab")],
+    }),
+    ("Fashion", {
+        "name": "Classic Denim Jeans",
+        "description": "Slim fit stretchable denim jeans",
+        "sku": "SAMPLE-JNS-001",
+        "mrp": 1999,
+        "selling_price": 1299,
+        "wholesale_price": 1099,
+        "cost_price": 800,
+        "stock_qty": 120,
+        "gst_rate": 12.0,
+        "hsn_code": "6203",
+        "images": [_product_image("1542272604-787c3835535d")],
+    }),
+    ("Home & Kitchen", {
+        "name": "Stainless Steel Water Bottle",
+        "description": "Insulated 1 litre bottle, keeps drinks cold for 24 hours",
+        "sku": "SAMPLE-BTL-001",
+        "mrp": 899,
+        "selling_price": 599,
+        "wholesale_price": 499,
+        "cost_price": 350,
+        "stock_qty": 150,
+        "gst_rate": 18.0,
+        "hsn_code": "7323",
+        "images": [_product_image("1602143407151-7111542de6e8")],
+    }),
+)
+
+_SAMPLE_BANNERS = (
+    ("Electronics", {
+        "title": "Big Electronics Sale",
+        "image_url": _banner_image("1498049794561-7780e7231661"),
+        "position": 1,
+        "is_active": True,
+    }),
+    ("Fashion", {
+        "title": "New Fashion Arrivals",
+        "image_url": _banner_image("1441986300917-64674bd600d8"),
+        "position": 2,
+        "is_active": True,
+    }),
+    ("Home & Kitchen", {
+        "title": "Home Essentials",
+        "image_url": _banner_image("1556911220-bff31c812dba"),
+        "position": 3,
+        "is_active": True,
+    }),
+)
+
+@router.post("/seed-data")
+def seed_data(admin: dict = Depends(admin_required), db: Session = Depends(get_db)):
+    """Seed sample categories, products and banners"""
+    try:
+        # Everything is written in one transaction, so if the last sample
+        # product and banner exist a previous seed completed: one boolean
+        # round-trip instead of re-running every lookup and upsert
+        already_seeded = db.scalar(select(and_(
+            exists().where(models.Product.sku == _SAMPLE_PRODUCTS[-1][1]["sku"]),
+            exists().where(models.Banner.title == _SAMPLE_BANNERS[-1][1]["title"])
+        )))
+        if already_seeded:
+            return {"message": "Sample data already exists", "categories": 0,
+                    "products": 0, "banners": 0, "product_ids": [], "skipped": []}
+        
+        now = datetime.utcnow()
+        
+        # Plain (id, name) rows are enough to resolve categories; no ORM objects needed
+        category_names = [c["name"] for c in _SAMPLE_CATEGORIES]
+        cat_by_name = {
+            name: cat_id
+            for cat_id, name in db.execute(
+                select(models.Category.id, models.Category.name)
+                .where(models.Category.name.in_(category_names))
+            ).all()
+        }
+        new_categories = [
+            {"id": generate_id(), **c, "is_active": True, "created_at": now}
+            for c in _SAMPLE_CATEGORIES
+            if c["name"] not in cat_by_name
+        ]
+        if new_categories:
+            db.execute(insert(models.Category), new_categories)
+            cat_by_name.update((c["name"], c["id"]) for c in new_categories)
+        default_cat = cat_by_name[category_names[0]]
+        
+        sample_products = [
+            {**p, "category_id": cat_by_name.get(cat_name, default_cat)}
+            for cat_name, p in _SAMPLE_PRODUCTS
+        ]
+        
+        # Products and banners each get a savepoint: a unique clash in one
+        # block rolls back only that block and the rest of the seed commits
+        skipped = []
+        
+        # products.sku is unique, so new and existing products go through one
+        # INSERT ... ON CONFLICT / ON DUPLICATE KEY UPDATE statement
+        update_columns = [k for k in sample_products[0] if k != "sku"] + ["updated_at"]
+        skus = [p["sku"] for p in sample_products]
+        try:
+            with db.begin_nested():
+                upsert(
+                    db,
+                    models.Product,
+                    [
+                        {"id": generate_id(), **p, "is_active": True, "created_at": now, "updated_at": now}
+                        for p in sample_products
+                    ],
+                    index_elements=["sku"],
+                    update_columns=update_columns
+                )
+            product_ids = db.execute(
+                select(models.Product.id).where(models.Product.sku.in_(skus))
+            ).scalars().all()
+        except IntegrityError:
+            skipped.append("products")
+            product_ids = []
+        
+        banners_data = [
+            {**b, "link": f"/products?category={cat_by_name.get(cat_name, default_cat)}"}
+            for cat_name, b in _SAMPLE_BANNERS
+        ]
+        
+        # One title lookup and one multi-row INSERT instead of a query + add per banner
+        titles = [b["title"] for b in banners_data]
+        existing_titles = {
+            title for (title,) in db.query(models.Banner.title).filter(models.Banner.title.in_(titles))
+        }
+        new_banners = [
+            {"id": generate_id(), **b, "created_at": now}
+            for b in banners_data
+            if b["title"] not in existing_titles
+        ]
+        if new_banners:
+            try:
+                with db.begin_nested():
+                    db.execute(insert(models.Banner), new_banners)
+            except IntegrityError:
+                skipped.append("banners")
+                new_banners = []
+        
+        db.commit()
+        categories_cache.clear()
+        banners_cache.clear()
+        
+        return {
+            "message": "Sample data created successfully",
+            "categories": len(cat_by_name),
+            "products": len(product_ids),
+            "banners": len(new_banners),
+            "product_ids": product_ids,
+            "skipped": skipped
+        }
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to seed data: {str(e)}")
+
 # =============== Couriers ===============
 
 @router.get("/couriers")
@@ -281,10 +504,10 @@ def create_product(
         if existing_product:
             raise HTTPException(status_code=400, detail=f"Product with SKU {product.sku} already exists")
 
+        # ProductCreate plus the column defaults cover every column, so no refresh
         db_product = models.Product(**product.dict())
         db.add(db_product)
         db.commit()
-        db.refresh(db_product)
         return db_product
     except HTTPException:
         raise
@@ -333,18 +556,61 @@ def bulk_upload_products(
     admin: dict = Depends(admin_required),
     db: Session = Depends(get_db)
 ):
-    """Bulk upload products"""
-    created_products = []
-    for product_data in products:
-        db_product = models.Product(**product_data.dict())
-        db.add(db_product)
-        created_products.append(db_product)
+    """Bulk upload products, updating those whose SKU already exists"""
+    if not products:
+        return {"message": "0 products created", "created": 0, "updated": 0, "products": []}
+    
+    now = datetime.utcnow()
+    # Keyed by SKU so a SKU repeated within one upload keeps its last row
+    rows = {
+        p.sku: {"id": generate_id(), **p.dict(), "created_at": now, "updated_at": now}
+        for p in products
+    }
+    skus = list(rows)
+    existing = set(db.execute(select(models.Product.sku).where(models.Product.sku.in_(skus))).scalars())
+    
+    # MySQL's ON DUPLICATE KEY UPDATE fires on any unique key, so a row whose
+    # barcode belongs to a different SKU would overwrite that other product.
+    # Reject such rows up front on every dialect.
+    barcode_skus = {}
+    clashes = set()
+    for sku, row in rows.items():
+        barcode = row.get("barcode")
+        if barcode:
+            if barcode_skus.setdefault(barcode, sku) != sku:
+                clashes.add(sku)
+    if barcode_skus:
+        clashes.update(
+            barcode_skus[barcode]
+            for sku, barcode in db.execute(
+                select(models.Product.sku, models.Product.barcode)
+                .where(models.Product.barcode.in_(list(barcode_skus)))
+            )
+            if sku != barcode_skus[barcode]
+        )
+    if clashes:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Barcode already used by another product for SKU(s): {', '.join(sorted(clashes))}"
+        )
     
-    db.commit()
-    for product in created_products:
-        db.refresh(product)
+    # One multi-row upsert on sku instead of an INSERT per product
+    update_columns = [k for k in next(iter(rows.values())) if k not in ("id", "sku", "created_at")]
+    try:
+        upsert(db, models.Product, list(rows.values()), index_elements=["sku"], update_columns=update_columns)
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Upload contains a barcode already used by another product")
     
-    return {"message": f"{len(created_products)} products created", "products": created_products}
+    saved = db.query(models.Product).filter(models.Product.sku.in_(skus)).all()
+    created = len(skus) - len(existing)
+    return {
+        "message": f"{created} products created, {len(existing)} updated",
+        "created": created,
+        "updated": len(existing),
+        "products": saved
+    }
 
 # =============== Categories (Admin) ===============
 
@@ -364,6 +630,7 @@ def create_category(
     db_category = models.Category(**category.dict())
     db.add(db_category)
     db.commit()
+    categories_cache.clear()
     db.refresh(db_category)
     return db_category
 
@@ -401,6 +668,7 @@ def update_category(
         setattr(db_category, key, value)
     
     db.commit()
+    categories_cache.clear()
     db.refresh(db_category)
     return db_category
 
@@ -447,6 +715,7 @@ def delete_category(
     
     db.delete(db_category)
     db.commit()
+    categories_cache.clear()
     return {"message": "Category deleted"}
 
 @router.get("/categories")
@@ -491,6 +760,7 @@ def create_banner(
     db_banner = models.Banner(**banner.dict())
     db.add(db_banner)
     db.commit()
+    banners_cache.clear()
     db.refresh(db_banner)
     return db_banner
 
@@ -510,6 +780,7 @@ def update_banner(
         setattr(db_banner, key, value)
     
     db.commit()
+    banners_cache.clear()
     db.refresh(db_banner)
     return db_banner
 
@@ -526,6 +797,7 @@ def delete_banner(
     
     db.delete(db_banner)
     db.commit()
+    banners_cache.clear()
     return {"message": "Banner deleted"}
 
 # =============== Offers (Admin) ===============
@@ -615,18 +887,21 @@ def get_inventory(
     
     products = query.all()
     
-    # Calculate stats
-    all_products = db.query(models.Product).all()
+    # Stats over the whole catalogue in one aggregate query
+    total_products, total_value, low_stock, out_of_stock = db.query(
+        func.count(models.Product.id),
+        func.coalesce(func.sum(models.Product.selling_price * models.Product.stock_qty), 0),
+        func.coalesce(func.sum(case(
+            (and_(models.Product.stock_qty > 0, models.Product.stock_qty <= models.Product.low_stock_threshold), 1),
+            else_=0
+        )), 0),
+        func.coalesce(func.sum(case((models.Product.stock_qty == 0, 1), else_=0)), 0)
+    ).one()
     sold_map = calculate_sold_qty_map(db)
     
-    total_value = sum(p.selling_price * p.stock_qty for p in all_products)
-    low_stock = len([p for p in all_products if 0 < p.stock_qty <= p.low_stock_threshold])
-    out_of_stock = len([p for p in all_products if p.stock_qty == 0])
-    
-    enriched_products = []
-    for p in products:
-        # Convert to dict manually to add custom field
-        p_dict = {
+    # Convert to dicts manually to add custom field
+    enriched_products = [
+        {
             "id": p.id,
             "name": p.name,
             "sku": p.sku,
@@ -651,15 +926,16 @@ def get_inventory(
             "updated_at": p.updated_at,
             "sold_qty": sold_map.get(p.id, 0)
         }
-        enriched_products.append(p_dict)
+        for p in products
+    ]
     
     return {
         "products": enriched_products,
         "stats": {
-            "total_products": len(all_products),
+            "total_products": total_products,
             "total_inventory_value": float(total_value),
-            "low_stock_count": low_stock,
-            "out_of_stock": out_of_stock
+            "low_stock_count": int(low_stock),
+            "out_of_stock": int(out_of_stock)
         }
     }
 
@@ -682,20 +958,41 @@ def update_inventory(
 
 # =============== Orders (Admin) ===============
 
+# The admin list and shipping screens don't show per-order history or notes
+ORDER_LIST_COLUMNS = tuple(
+    column for column in models.Order.__table__.columns if column.key not in ("tracking_history", "notes")
+)
+
 @router.get("/orders")
 def get_all_orders(
     status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=500),
     admin: dict = Depends(admin_required),
     db: Session = Depends(get_db)
 ):
-    """Get all orders with optional status filter"""
-    query = db.query(models.Order)
+    """Get all orders with optional status filter, newest first"""
+    # Customer names come back with the orders through one outer join
+    query = db.query(
+        *ORDER_LIST_COLUMNS, models.User.name.label("customer_name")
+    ).outerjoin(models.User, models.Order.user_id == models.User.id)
     
     if status:
         query = query.filter(models.Order.status == status)
     
-    orders = query.order_by(desc(models.Order.created_at)).all()
-    return {"orders": orders}
+    # Paging is opt-in: the admin screens load the full list
+    if cursor is None and limit is None:
+        rows = query.order_by(desc(models.Order.created_at), desc(models.Order.id)).all()
+        next_cursor = None
+    else:
+        rows, next_cursor = keyset_page(query, models.Order, cursor, limit or 100)
+    orders = []
+    for row in rows:
+        order_dict = row._asdict()
+        order_dict["customer_name"] = row.customer_name or (row.shipping_address or {}).get("name")
+        orders.append(order_dict)
+    # Already plain dicts; let orjson encode them without jsonable_encoder
+    return ORJSONResponse({"orders": orders, "next_cursor": next_cursor})
 
 @router.put("/orders/{order_id}/status")
 def update_order_status(
@@ -710,9 +1007,9 @@ def update_order_status(
         raise HTTPException(status_code=404, detail="Order not found")
     
     db_order.status = status
+    db.add(models.TrackingHistory(order_id=db_order.id, status=status, updated_by=admin.get("name")))
     db.commit()
-    db.refresh(db_order)
-    return db_order
+    return order_detail(db, db_order)
 
 # =============== Returns (Admin) ===============
 
@@ -972,6 +1269,7 @@ def update_customer(
     
     customer.is_active = is_active
     db.commit()
+    invalidate_user(customer_id)
     db.refresh(customer)
     return customer
 
@@ -979,14 +1277,21 @@ def update_customer(
 
 @router.get("/notifications")
 def get_admin_notifications(
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=100),
     admin: dict = Depends(admin_required),
     db: Session = Depends(get_db)
 ):
     """Get admin notifications"""
-    notifications = db.query(models.Notification).filter(
-        models.Notification.user_id == admin["id"]
-    ).order_by(desc(models.Notification.created_at)).limit(50).all()
-    return notifications
+    query = db.query(models.Notification).filter(
+        *NotificationService.feed_filter(admin["id"])
+    )
+    notifications, next_cursor = keyset_page(query, models.Notification, cursor, limit)
+    return {
+        "notifications": notifications,
+        "unread_count": NotificationService.unread_count(db, admin["id"]),
+        "next_cursor": next_cursor
+    }
 
 @router.get("/notifications/unread-count")
 def get_unread_notifications_count(
@@ -994,11 +1299,30 @@ def get_unread_notifications_count(
     db: Session = Depends(get_db)
 ):
     """Get unread notifications count"""
-    count = db.query(models.Notification).filter(
-        models.Notification.user_id == admin["id"],
+    count = NotificationService.unread_count(db, admin["id"])
+    return {"unread_count": count, "count": count}
+
+@router.get("/notifications/has-unread")
+def has_unread_notifications(
+    admin: dict = Depends(admin_required),
+    db: Session = Depends(get_db)
+):
+    """Whether the admin has any unread notification"""
+    return {"has_unread": NotificationService.has_unread(db, admin["id"])}
+
+@router.put("/notifications/mark-all-read")
+def mark_all_notifications_read(
+    admin: dict = Depends(admin_required),
+    db: Session = Depends(get_db)
+):
+    """Mark all admin notifications as read"""
+    updated = db.query(models.Notification).filter(
+        *NotificationService.feed_filter(admin["id"]),
         models.Notification.read == False
-    ).count()
-    return {"count": count}
+    ).update({"read": True}, synchronize_session=False)
+    db.commit()
+    NotificationService.invalidate(admin["id"])
+    return {"message": "All notifications marked as read", "updated": updated}
 
 @router.put("/notifications/{notification_id}/read")
 def mark_notification_read(
@@ -1007,21 +1331,26 @@ def mark_notification_read(
     db: Session = Depends(get_db)
 ):
     """Mark notification as read"""
-    notification = db.query(models.Notification).filter(
-        models.Notification.id == notification_id
-    ).first()
-    if not notification:
+    # One UPDATE scoped to the admin's own feed; the row count is the existence check
+    updated = db.query(models.Notification).filter(
+        models.Notification.id == notification_id,
+        *NotificationService.feed_filter(admin["id"])
+    ).update({"read": True}, synchronize_session=False)
+    if not updated:
         raise HTTPException(status_code=404, detail="Notification not found")
     
-    notification.read = True
     db.commit()
+    NotificationService.invalidate(admin["id"])
     return {"message": "Notification marked as read"}
 
 # =============== Seller Requests ===============
 
 @router.get("/seller-requests")
 def get_seller_requests(
+    response: Response,
     status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=500),
     admin: dict = Depends(admin_required),
     db: Session = Depends(get_db)
 ):
@@ -1031,7 +1360,13 @@ def get_seller_requests(
     if status:
         query = query.filter(models.SellerRequest.status == status)
     
-    requests = query.order_by(desc(models.SellerRequest.created_at)).all()
+    # Paging is opt-in, as for orders. The body stays a plain list; the next
+    # cursor goes in a header
+    if cursor is None and limit is None:
+        return query.order_by(desc(models.SellerRequest.created_at), desc(models.SellerRequest.id)).all()
+    requests, next_cursor = keyset_page(query, models.SellerRequest, cursor, limit or 100)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return requests
 
 @router.put("/seller-requests/{request_id}")
@@ -1057,6 +1392,7 @@ def update_seller_request(
             user.role = "seller"
     
     db.commit()
+    invalidate_user(request.user_id)
     db.refresh(request)
     return request
 
@@ -1108,6 +1444,7 @@ def update_page(
         page.content = content
     
     db.commit()
+    pages_cache.pop(slug)
     db.refresh(page)
     return page
 
@@ -1144,8 +1481,11 @@ def get_team_members(
     db: Session = Depends(get_db)
 ):
     """Get all team members (admins and customers)"""
-    users = db.query(models.User).order_by(desc(models.User.created_at)).all()
-    return {"users": users}
+    # Plain column rows: no ORM instances to hydrate and no password hash
+    users = db.execute(
+        select(*(getattr(models.User, c) for c in USER_COLUMNS)).order_by(desc(models.User.created_at))
+    ).mappings().all()
+    return ORJSONResponse({"users": [dict(u) for u in users]})
 
 @router.post("/team")
 def create_team_member(
@@ -1178,9 +1518,8 @@ def create_team_member(
     
     db.add(new_user)
     db.commit()
-    db.refresh(new_user)
     
-    return {"user": new_user, "temporary_password": temp_password}
+    return {"user": user_to_dict(new_user), "temporary_password": temp_password}
 
 @router.delete("/team/{user_id}")
 def remove_admin_access(
@@ -1198,6 +1537,7 @@ def remove_admin_access(
     
     user.role = "customer"
     db.commit()
+    invalidate_user(user_id)
     return {"message": "Admin access removed"}
 
 @router.put("/users/{user_id}/role")
@@ -1217,4 +1557,5 @@ def update_user_role(
     
     user.role = role_data.get("role")
     db.commit()
+    invalidate_user(user_id)
     return user
\ No newline at end of file
@@ -3,12 +3,13 @@ Authentication endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
 from datetime import datetime, timezone, timedelta
+from typing import Optional
 import logging
+import re
 
-from app.core.database import get_db
-from app.core.security import hash_password, verify_password, create_access_token, get_current_user
+from app.core.database import get_db, upsert
+from app.core.security import hash_password, verify_password, create_access_token, get_current_user, user_to_dict
 from app.core.utils import generate_otp, generate_id
 from app.schemas.auth import OTPRequest, OTPVerify, ForgotPasswordRequest, Token
 from app.schemas.user import UserCreate, UserLogin, UserResponse
@@ -20,22 +21,41 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Identifier shapes, compiled once at import rather than per login
+PHONE_RE = re.compile(r"\+?\d{10,15}")
+EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+def first_user_where(db: Session, column, value: str) -> Optional[models.User]:
+    """First user whose column equals value"""
+    return db.query(models.User).filter(column == value).first()
+
+def find_user_by_identifier(db: Session, identifier: str) -> Optional[models.User]:
+    """Find a user by phone or email, each through its own unique index"""
+    # Identifiers that can only be one kind need a single lookup
+    if PHONE_RE.fullmatch(identifier):
+        return first_user_where(db, models.User.phone, identifier)
+    if EMAIL_RE.fullmatch(identifier):
+        return first_user_where(db, models.User.email, identifier)
+    # Two point lookups instead of one OR across columns, which planners often turn into a scan
+    return (
+        first_user_where(db, models.User.phone, identifier)
+        or first_user_where(db, models.User.email, identifier)
+    )
+
 @router.post("/send-otp")
 def send_otp(data: OTPRequest, db: Session = Depends(get_db)):
     """Send OTP via SMS with Email fallback"""
     otp = generate_otp()
     expiry = datetime.now(timezone.utc) + timedelta(minutes=10)
     
-    # Upsert OTP
-    existing_otp = db.query(models.OTP).filter(models.OTP.phone == data.phone).first()
-    if existing_otp:
-        existing_otp.otp = otp
-        existing_otp.expiry = expiry
-        existing_otp.verified = False
-    else:
-        new_otp = models.OTP(phone=data.phone, otp=otp, expiry=expiry, verified=False)
-        db.add(new_otp)
-    
+    # Upsert OTP in one atomic statement on the unique phone
+    upsert(
+        db,
+        models.OTP,
+        [{"phone": data.phone, "otp": otp, "expiry": expiry, "verified": False}],
+        index_elements=["phone"],
+        update_columns=["otp", "expiry", "verified"]
+    )
     db.commit()
     
     # Try SMS first
@@ -65,18 +85,23 @@ def send_otp(data: OTPRequest, db: Session = Depends(get_db)):
 @router.post("/verify-otp")
 def verify_otp(data: OTPVerify, db: Session = Depends(get_db)):
     """Verify OTP"""
-    otp_doc = db.query(models.OTP).filter(models.OTP.phone == data.phone).first()
-    if not otp_doc:
-        raise HTTPException(status_code=400, detail="No OTP found for this phone")
-    
-    if otp_doc.otp != data.otp:
-        raise HTTPException(status_code=400, detail="Invalid OTP")
+    # Check and mark the OTP in one conditional UPDATE on the unique phone
+    verified = db.query(models.OTP).filter(
+        models.OTP.phone == data.phone,
+        models.OTP.otp == data.otp,
+        models.OTP.expiry >= datetime.utcnow()
+    ).update({models.OTP.verified: True}, synchronize_session=False)
+    db.commit()
     
-    if datetime.utcnow() > otp_doc.expiry: 
+    if not verified:
+        # Only a failed attempt pays for the lookup that explains why
+        otp_doc = db.query(models.OTP).filter(models.OTP.phone == data.phone).first()
+        if not otp_doc:
+            raise HTTPException(status_code=400, detail="No OTP found for this phone")
+        if otp_doc.otp != data.otp:
+            raise HTTPException(status_code=400, detail="Invalid OTP")
         raise HTTPException(status_code=400, detail="OTP expired")
     
-    otp_doc.verified = True
-    db.commit()
     return {"message": "OTP verified successfully", "verified": True}
 
 @router.post("/register", response_model=dict)
@@ -128,8 +153,7 @@ def register(data: UserCreate, db: Session = Depends(get_db)):
     token = create_access_token(new_user.id, "customer")
     
     # Convert user to dict
-    user_dict = {c.name: getattr(new_user, c.name) for c in new_user.__table__.columns}
-    user_dict.pop("password")
+    user_dict = user_to_dict(new_user)
     
     return {"token": token, "user": user_dict}
 
@@ -137,12 +161,7 @@ def register(data: UserCreate, db: Session = Depends(get_db)):
 def login(data: UserLogin, db: Session = Depends(get_db)):
     """Login user"""
     # Check by phone OR email
-    user = db.query(models.User).filter(
-        or_(
-            models.User.phone == data.identifier,
-            models.User.email == data.identifier
-        )
-    ).first()
+    user = find_user_by_identifier(db, data.identifier)
     
     if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -152,8 +171,7 @@ def login(data: UserLogin, db: Session = Depends(get_db)):
     
     token = create_access_token(user.id, user.role)
     
-    user_dict = {c.name: getattr(user, c.name) for c in user.__table__.columns}
-    user_dict.pop("password")
+    user_dict = user_to_dict(user)
     
     return {"token": token, "user": user_dict}
 
@@ -164,12 +182,7 @@ def forgot_password(data: ForgotPasswordRequest, db: Session = Depends(get_db)):
     if not identifier:
         raise HTTPException(status_code=400, detail="Please provide phone or email")
         
-    user = db.query(models.User).filter(
-        or_(
-            models.User.email == identifier,
-            models.User.phone == identifier
-        )
-    ).first()
+    user = find_user_by_identifier(db, identifier)
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
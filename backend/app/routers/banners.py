@@ -1,9 +1,12 @@
 """
 Banner endpoints
 """
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
+import orjson
 
+from app.core.cache import banners_cache
 from app.core.database import get_db
 from app import models
 
@@ -12,7 +15,11 @@ router = APIRouter()
 @router.get("/")
 def get_banners(db: Session = Depends(get_db)):
     """Get active banners"""
-    banners = db.query(models.Banner).filter(
-        models.Banner.is_active == True
-    ).order_by(models.Banner.position).all()
-    return banners
\ No newline at end of file
+    body = banners_cache.get("active")
+    if body is None:
+        banners = db.query(models.Banner).filter(
+            models.Banner.is_active == True
+        ).order_by(models.Banner.position).all()
+        body = orjson.dumps(jsonable_encoder(banners))
+        banners_cache.set("active", body)
+    return Response(content=body, media_type="application/json")
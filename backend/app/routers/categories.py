@@ -1,10 +1,13 @@
 """
 Category endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
+import orjson
 
+from app.core.cache import categories_cache
 from app.core.database import get_db
 from app import models
 
@@ -53,6 +56,14 @@ def flatten_category_tree(tree: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     add_to_list(tree)
     return flat_list
 
+def cached_response(key: tuple, build: Callable[[], Any]) -> Response:
+    """Serve a rendered category listing from cache, building it on a miss"""
+    body = categories_cache.get(key)
+    if body is None:
+        body = orjson.dumps(jsonable_encoder(build()))
+        categories_cache.set(key, body)
+    return Response(content=body, media_type="application/json")
+
 @router.get("/")
 def get_categories(
     flat: bool = Query(False, description="Return flat list instead of tree"),
@@ -60,49 +71,57 @@ def get_categories(
     db: Session = Depends(get_db)
 ):
     """Get all active categories as tree or flat list"""
-    query = db.query(models.Category).filter(models.Category.is_active == True)
-    
-    if parent_id is not None:
-        if parent_id == "":  # Root categories only
-            query = query.filter(models.Category.parent_id.is_(None))
-        else:
-            query = query.filter(models.Category.parent_id == parent_id)
-    
-    categories = query.all()
-    
-    if flat or parent_id is not None:
-        return [
-            {
-                "id": cat.id,
-                "name": cat.name,
-                "description": cat.description,
-                "image_url": cat.image_url,
-                "parent_id": cat.parent_id,
-                "is_active": cat.is_active,
-                "created_at": cat.created_at,
-                "level": cat.level,
-                "full_path": cat.full_path,
-                "has_children": len(cat.children) > 0
-            }
-            for cat in categories
-        ]
-    
-    # Return hierarchical tree
-    tree = build_category_tree(categories)
-    return tree
+    def build():
+        query = db.query(models.Category).filter(models.Category.is_active == True)
+        
+        if parent_id is not None:
+            if parent_id == "":  # Root categories only
+                query = query.filter(models.Category.parent_id.is_(None))
+            else:
+                query = query.filter(models.Category.parent_id == parent_id)
+        
+        categories = query.all()
+        
+        if flat or parent_id is not None:
+            return [
+                {
+                    "id": cat.id,
+                    "name": cat.name,
+                    "description": cat.description,
+                    "image_url": cat.image_url,
+                    "parent_id": cat.parent_id,
+                    "is_active": cat.is_active,
+                    "created_at": cat.created_at,
+                    "level": cat.level,
+                    "full_path": cat.full_path,
+                    "has_children": len(cat.children) > 0
+                }
+                for cat in categories
+            ]
+        
+        # Return hierarchical tree
+        tree = build_category_tree(categories)
+        return tree
+        
+    return cached_response(("list", flat, parent_id), build)
 
 @router.get("/flat")
 def get_categories_flat(db: Session = Depends(get_db)):
     """Get all categories as a flat list with hierarchy information"""
-    categories = db.query(models.Category).filter(models.Category.is_active == True).all()
-    tree = build_category_tree(categories)
-    return flatten_category_tree(tree)
+    def build():
+        categories = db.query(models.Category).filter(models.Category.is_active == True).all()
+        return flatten_category_tree(build_category_tree(categories))
+    
+    return cached_response(("flat",), build)
 
 @router.get("/tree")
 def get_categories_tree(db: Session = Depends(get_db)):
     """Get categories as hierarchical tree"""
-    categories = db.query(models.Category).filter(models.Category.is_active == True).all()
-    return build_category_tree(categories)
+    def build():
+        categories = db.query(models.Category).filter(models.Category.is_active == True).all()
+        return build_category_tree(categories)
+    
+    return cached_response(("tree",), build)
 
 @router.get("/{category_id}")
 def get_category(category_id: str, db: Session = Depends(get_db)):
@@ -10,10 +10,22 @@ from app.core.database import get_db
 from app.core.security import admin_required
 from app.services.courier_service import DelhiveryService
 from app.core.config import settings
+from app.core.cache import tracking_cache
 from app import models
 
 router = APIRouter()
 
+def cached_tracking(awb: str) -> Dict[str, Any]:
+    """Track an AWB, serving live carrier results from the tracking cache"""
+    result = tracking_cache.get(awb)
+    if result is None:
+        delhivery_service = DelhiveryService(settings.DELHIVERY_TOKEN or "")
+        result = delhivery_service.track_order(awb)
+        # Mock fallbacks carry a note; only cache real carrier data
+        if result.get("success") and "note" not in result:
+            tracking_cache.set(awb, result)
+    return result
+
 class AddressValidation(BaseModel):
     name: str
     phone: str
@@ -123,8 +135,7 @@ def track_order(order_id: str, db: Session = Depends(get_db)):
         return {"message": "Order not yet shipped", "status": order.status}
     
     try:
-        delhivery_service = DelhiveryService(settings.DELHIVERY_TOKEN or "")
-        result = delhivery_service.track_order(order.tracking_number)
+        result = cached_tracking(order.tracking_number)
         return result
     except Exception as e:
         return {
@@ -138,8 +149,7 @@ def track_order(order_id: str, db: Session = Depends(get_db)):
 def track_by_awb(awb: str, db: Session = Depends(get_db)):
     """Track shipment by AWB number"""
     try:
-        delhivery_service = DelhiveryService(settings.DELHIVERY_TOKEN or "")
-        result = delhivery_service.track_order(awb)
+        result = cached_tracking(awb)
         return result
     except Exception as e:
         return {
@@ -210,6 +220,7 @@ def cancel_shipment(order_id: str, admin: dict = Depends(admin_required), db: Se
         if result.get("success"):
             order.status = "cancelled"
             db.commit()
+            tracking_cache.pop(order.tracking_number)
         
         return result
     except Exception as e:
@@ -1,19 +1,93 @@
 """
 Notification endpoints
 """
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.core.database import get_db
+from app.core.pagination import keyset_page
 from app.core.security import get_current_user
+from app.services.notification_service import NotificationService
+from app import models
 
 router = APIRouter()
 
 @router.get("/")
-def get_user_notifications(user: dict = Depends(get_current_user)):
+def get_user_notifications(
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=100),
+    user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
     """Get user notifications"""
-    # TODO: Implement notification logic from original server.py
-    return {"message": "Notifications endpoint - TODO: implement"}
+    query = db.query(models.Notification).filter(*NotificationService.feed_filter(user["id"]))
+    notifications, next_cursor = keyset_page(query, models.Notification, cursor, limit)
+    return {
+        "notifications": notifications,
+        "unread_count": NotificationService.unread_count(db, user["id"]),
+        "next_cursor": next_cursor
+    }
 
 @router.get("/unread-count")
-def get_unread_notification_count(user: dict = Depends(get_current_user)):
+def get_unread_notification_count(user: dict = Depends(get_current_user), db: Session = Depends(get_db)):
     """Get unread notification count"""
-    # TODO: Implement unread count logic
-    return {"unread_count": 0}
\ No newline at end of file
+    return {"unread_count": NotificationService.unread_count(db, user["id"])}
+
+@router.get("/has-unread")
+def has_unread_notifications(user: dict = Depends(get_current_user), db: Session = Depends(get_db)):
+    """Whether there is any unread notification, for badges that only show a dot"""
+    return {"has_unread": NotificationService.has_unread(db, user["id"])}
+
+# Writes are a single UPDATE/DELETE scoped to the caller's feed; the affected
+# row count doubles as the existence check (MySQL has no RETURNING)
+
+@router.put("/mark-all-read")
+def mark_all_notifications_read(user: dict = Depends(get_current_user), db: Session = Depends(get_db)):
+    """Mark all of the user's notifications as read"""
+    # Only unread rows match, so this walks the unread index rather than the history
+    updated = db.query(models.Notification).filter(
+        *NotificationService.feed_filter(user["id"]),
+        models.Notification.read == False
+    ).update({"read": True}, synchronize_session=False)
+    db.commit()
+    NotificationService.invalidate(user["id"])
+    return {"message": "All notifications marked as read", "updated": updated}
+
+@router.put("/{notification_id}/read")
+def mark_notification_read(notification_id: str, user: dict = Depends(get_current_user), db: Session = Depends(get_db)):
+    """Mark notification as read"""
+    updated = db.query(models.Notification).filter(
+        models.Notification.id == notification_id,
+        *NotificationService.feed_filter(user["id"])
+    ).update({"read": True}, synchronize_session=False)
+    if not updated:
+        raise HTTPException(status_code=404, detail="Notification not found")
+    
+    db.commit()
+    NotificationService.invalidate(user["id"])
+    return {"message": "Notification marked as read"}
+
+@router.delete("/{notification_id}")
+def delete_notification(notification_id: str, user: dict = Depends(get_current_user), db: Session = Depends(get_db)):
+    """Delete a notification"""
+    deleted = db.query(models.Notification).filter(
+        models.Notification.id == notification_id,
+        *NotificationService.feed_filter(user["id"])
+    ).delete(synchronize_session=False)
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Notification not found")
+    
+    db.commit()
+    NotificationService.invalidate(user["id"])
+    return {"message": "Notification deleted"}
+
+@router.delete("/")
+def clear_notifications(user: dict = Depends(get_current_user), db: Session = Depends(get_db)):
+    """Delete all of the user's notifications"""
+    deleted = db.query(models.Notification).filter(
+        *NotificationService.feed_filter(user["id"])
+    ).delete(synchronize_session=False)
+    db.commit()
+    NotificationService.invalidate(user["id"])
+    return {"message": "Notifications cleared", "deleted": deleted}
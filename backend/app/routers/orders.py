@@ -2,10 +2,13 @@
 Order endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import bindparam, update
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from collections import defaultdict
 import logging
 
 from app.core.database import get_db
@@ -57,11 +60,18 @@ def create_order(data: OrderCreate, request: Request, db: Session = Depends(get_
     items_valid = []
     subtotal = 0
     
+    # One IN query for the whole cart instead of a lookup per line
+    product_ids = {item.product_id for item in data.items}
+    products = {
+        p.id: p for p in db.query(models.Product).filter(models.Product.id.in_(product_ids)).all()
+    }
+    
+    quantities = defaultdict(int)
     for item in data.items:
-        prod = db.query(models.Product).filter(models.Product.id == item.product_id).first()
+        prod = products.get(item.product_id)
         if not prod:
             raise HTTPException(status_code=400, detail=f"Product {item.product_id} not found")
-        if prod.stock_qty < item.quantity:
+        if prod.stock_qty < quantities[prod.id] + item.quantity:
             raise HTTPException(status_code=400, detail=f"Insufficient stock for {prod.name}")
         
         price = prod.selling_price
@@ -84,9 +94,7 @@ def create_order(data: OrderCreate, request: Request, db: Session = Depends(get_
             "image_url": prod.images[0] if prod.images else None
         })
         subtotal += item_total
-        
-        # Update stock
-        prod.stock_qty -= item.quantity
+        quantities[prod.id] += item.quantity
 
     total_gst = sum(i["gst_amount"] for i in items_valid)
     
@@ -97,6 +105,21 @@ def create_order(data: OrderCreate, request: Request, db: Session = Depends(get_
     
     grand_total = subtotal + total_gst - discount_amount
     
+    # Decrement stock in SQL rather than through the loaded objects; the
+    # stock_qty guard also stops a concurrent checkout from overselling
+    product_table = models.Product.__table__
+    for product_id, quantity in quantities.items():
+        result = db.execute(
+            update(product_table)
+            .where(product_table.c.id == product_id, product_table.c.stock_qty >= quantity)
+            .values(stock_qty=product_table.c.stock_qty - quantity)
+        )
+        if result.rowcount != 1:
+            db.rollback()
+            raise HTTPException(status_code=400, detail=f"Insufficient stock for {products[product_id].name}")
+    
+    now = datetime.utcnow()
+    
     new_order = models.Order(
         id=generate_id(),
         order_number=generate_order_number(),
@@ -110,24 +133,85 @@ def create_order(data: OrderCreate, request: Request, db: Session = Depends(get_
         grand_total=grand_total,
         shipping_address=data.shipping_address,
         payment_method=data.payment_method,
+        payment_status="pending",
         status="pending",
         is_offline=data.is_offline,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
+        tracking_number=None,
+        courier_provider=None,
+        tracking_history=[],
+        notes=[],
+        created_at=now,
+        updated_at=now
     )
     db.add(new_order)
+    # Every column is set above and sessions don't expire on commit, so the
+    # returned object is complete without a refresh SELECT
     db.commit()
-    db.refresh(new_order)
     
     return new_order
 
+def tracking_history_for(db: Session, orders) -> Dict[str, list]:
+    """Legacy JSON tracking entries plus TrackingHistory rows, keyed by order id"""
+    history = defaultdict(list)
+    for order in orders:
+        history[order.id].extend(order.tracking_history or [])
+    
+    if orders:
+        rows = db.query(models.TrackingHistory).filter(
+            models.TrackingHistory.order_id.in_([order.id for order in orders])
+        ).order_by(models.TrackingHistory.order_id, models.TrackingHistory.timestamp).all()
+        for row in rows:
+            history[row.order_id].append({
+                "status": row.status,
+                "timestamp": row.timestamp.isoformat() if row.timestamp else None,
+                "notes": row.notes,
+                "updated_by": row.updated_by
+            })
+    
+    return history
+
+def order_detail(db: Session, order: models.Order) -> Dict[str, Any]:
+    """Order fields with its legacy and TrackingHistory entries merged"""
+    order_dict = {column.key: getattr(order, column.key) for column in models.Order.__table__.columns}
+    order_dict["tracking_history"] = tracking_history_for(db, [order])[order.id]
+    return order_dict
+
+# Order list views skip the per-order history JSON unless asked for it
+ORDER_LIST_COLUMNS = tuple(
+    column for column in models.Order.__table__.columns if column.key != "tracking_history"
+)
+
 @router.get("/")
-def get_user_orders(user: dict = Depends(get_current_user), db: Session = Depends(get_db)):
+def get_user_orders(
+    include_tracking: bool = False,
+    user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
     """Get current user's orders"""
-    orders = db.query(models.Order).filter(
+    columns = ORDER_LIST_COLUMNS + ((models.Order.tracking_history,) if include_tracking else ())
+    orders = db.query(*columns).filter(
         models.Order.user_id == user["id"]
     ).order_by(models.Order.created_at.desc()).limit(100).all()
     
+    # Cover images for every item stored without one, in a single IN query
+    missing_ids = {
+        item["product_id"]
+        for order in orders
+        for item in (order.items or [])
+        if isinstance(item, dict) and not item.get("image_url") and item.get("product_id")
+    }
+    images = {}
+    if missing_ids:
+        images = {
+            product_id: product_images[0]
+            for product_id, product_images in db.query(models.Product.id, models.Product.images).filter(
+                models.Product.id.in_(missing_ids)
+            )
+            if product_images
+        }
+    
+    history = tracking_history_for(db, orders) if include_tracking else None
+    
     # Enrich orders with current product information
     enriched_orders = []
     for order in orders:
@@ -148,31 +232,30 @@ def get_user_orders(user: dict = Depends(get_current_user), db: Session = Depend
             "is_offline": order.is_offline,
             "tracking_number": order.tracking_number,
             "courier_provider": order.courier_provider,
-            "tracking_history": order.tracking_history,
             "notes": order.notes,
             "created_at": order.created_at,
             "updated_at": order.updated_at,
             "items": []
         }
+        if include_tracking:
+            order_dict["tracking_history"] = history[order.id]
         
         # Enrich items with current product images if missing
         if order.items:
             for item in order.items:
                 enriched_item = dict(item) if isinstance(item, dict) else item
                 
-                # If image_url is missing, fetch from current product
-                if not enriched_item.get("image_url"):
-                    product_id = enriched_item.get("product_id")
-                    if product_id:
-                        product = db.query(models.Product).filter(models.Product.id == product_id).first()
-                        if product and product.images and len(product.images) > 0:
-                            enriched_item["image_url"] = product.images[0]
+                # If image_url is missing, use the current product's cover image
+                if not enriched_item.get("image_url") and enriched_item.get("product_id") in images:
+                    enriched_item["image_url"] = images[enriched_item["product_id"]]
                 
                 order_dict["items"].append(enriched_item)
         
         enriched_orders.append(order_dict)
     
-    return enriched_orders
+    # Plain dicts of JSON-native values: orjson encodes them (datetimes
+    # included) directly, skipping FastAPI's jsonable_encoder pass
+    return ORJSONResponse(enriched_orders)
 
 @router.get("/{order_id}")
 def get_order_by_id(order_id: str, user: dict = Depends(get_current_user), db: Session = Depends(get_db)):
@@ -185,7 +268,7 @@ def get_order_by_id(order_id: str, user: dict = Depends(get_current_user), db: S
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
     
-    return order
+    return order_detail(db, order)
 
 @router.get("/{order_id}/can-cancel")
 def check_cancellation_eligibility(order_id: str, user: dict = Depends(get_current_user), db: Session = Depends(get_db)):
@@ -220,26 +303,33 @@ def cancel_order(order_id: str, data: OrderCancellationRequest, user: dict = Dep
         raise HTTPException(status_code=400, detail=f"Cannot cancel order with status: {order.status}")
     
     # Update order status
+    now = datetime.utcnow()
     order.status = "cancelled"
-    order.updated_at = datetime.utcnow()
+    order.updated_at = now
     
     # Add to tracking history
-    if not order.tracking_history:
-        order.tracking_history = []
-    
-    tracking_entry = {
-        "status": "cancelled",
-        "timestamp": datetime.utcnow().isoformat(),
-        "notes": f"Order cancelled: {data.reason}",
-        "updated_by": user["name"]
-    }
-    order.tracking_history.append(tracking_entry)
-    
-    # Restore inventory
-    for item in order.items:
-        product = db.query(models.Product).filter(models.Product.id == item.get("product_id")).first()
-        if product:
-            product.stock_qty += item.get("quantity", 1)
+    db.add(models.TrackingHistory(
+        order_id=order.id,
+        status="cancelled",
+        timestamp=now,
+        notes=f"Order cancelled: {data.reason}",
+        updated_by=user["name"]
+    ))
+    
+    # Restore inventory: one executemany UPDATE incrementing stock in place,
+    # rather than loading each product first
+    restock = defaultdict(int)
+    for item in order.items or []:
+        if item.get("product_id"):
+            restock[item["product_id"]] += item.get("quantity", 1)
+    if restock:
+        products = models.Product.__table__
+        db.execute(
+            update(products)
+            .where(products.c.id == bindparam("product_id"))
+            .values(stock_qty=products.c.stock_qty + bindparam("quantity")),
+            [{"product_id": pid, "quantity": qty} for pid, qty in restock.items()]
+        )
     
     db.commit()
     
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
+from app.core.cache import pages_cache
 from app.core.database import get_db
 from app.core.security import admin_required
 from app import models
@@ -38,65 +39,58 @@ def get_or_create_page(db: Session, slug: str, default_title: str = "", default_
         db.refresh(page)
     return page
 
+def cached_page(db: Session, slug: str, default_title: str, default_content: str) -> dict:
+    """Public page body, cached per slug for up to 30s (updates clear this worker only)"""
+    body = pages_cache.get(slug)
+    if body is None:
+        page = get_or_create_page(db, slug, default_title, default_content)
+        body = {
+            "title": page.title,
+            "content": page.content,
+            "updated_at": page.updated_at
+        }
+        pages_cache.set(slug, body)
+    return body
+
 @router.get("/privacy-policy")
 def get_privacy_policy(db: Session = Depends(get_db)):
     """Get privacy policy page"""
-    page = get_or_create_page(
-        db, 
-        "privacy-policy", 
+    return cached_page(
+        db,
+        "privacy-policy",
         "Privacy Policy",
         "This is the privacy policy content. Please update this content from the admin panel."
     )
-    return {
-        "title": page.title,
-        "content": page.content,
-        "updated_at": page.updated_at
-    }
 
 @router.get("/terms")
 def get_terms_of_service(db: Session = Depends(get_db)):
     """Get terms of service page"""
-    page = get_or_create_page(
-        db, 
-        "terms", 
+    return cached_page(
+        db,
+        "terms",
         "Terms of Service",
         "This is the terms of service content. Please update this content from the admin panel."
     )
-    return {
-        "title": page.title,
-        "content": page.content,
-        "updated_at": page.updated_at
-    }
 
 @router.get("/return-policy")
 def get_return_policy(db: Session = Depends(get_db)):
     """Get return policy page"""
-    page = get_or_create_page(
-        db, 
-        "return-policy", 
+    return cached_page(
+        db,
+        "return-policy",
         "Return Policy",
         "This is the return policy content. Please update this content from the admin panel."
     )
-    return {
-        "title": page.title,
-        "content": page.content,
-        "updated_at": page.updated_at
-    }
 
 @router.get("/contact")
 def get_contact_page(db: Session = Depends(get_db)):
     """Get contact page"""
-    page = get_or_create_page(
-        db, 
-        "contact", 
+    return cached_page(
+        db,
+        "contact",
         "Contact Us",
         "Contact us for any queries or support."
     )
-    return {
-        "title": page.title,
-        "content": page.content,
-        "updated_at": page.updated_at
-    }
 
 @router.post("/contact")
 def submit_contact_form(message: ContactMessage, db: Session = Depends(get_db)):
@@ -131,6 +125,7 @@ def update_page(slug: str, data: PageUpdate, admin: dict = Depends(admin_require
     
     db.commit()
     db.refresh(page)
+    pages_cache.pop(slug)
     
     return {
         "message": "Page updated successfully",
@@ -3,14 +3,80 @@ Product endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, desc, asc
+from sqlalchemy import or_, desc, asc, func
+from sqlalchemy.dialects.mysql import match as mysql_match
 from typing import Optional
+import re
 
+from app.core.cache import TTLCache
 from app.core.database import get_db
+from app.core.pagination import encode_cursor, keyset_page
 from app import models
 
 router = APIRouter()
 
+# Storefront listing totals by filter. A total up to 30s stale only shifts
+# the page count, and saves a COUNT(*) on every page request.
+_listing_totals = TTLCache(maxsize=1024, ttl=30)
+
+# InnoDB's default innodb_ft_min_token_size; shorter words aren't in the index
+FULLTEXT_MIN_TOKEN = 3
+
+# InnoDB's default stopword list (INFORMATION_SCHEMA.INNODB_FT_DEFAULT_STOPWORD).
+# These are never indexed, so a required "+the*" term would match no rows.
+FULLTEXT_STOPWORDS = frozenset({
+    "a", "about", "an", "are", "as", "at", "be", "by", "com", "de", "en", "for",
+    "from", "how", "i", "in", "is", "it", "la", "of", "on", "or", "that", "the",
+    "this", "to", "was", "what", "when", "where", "who", "will", "with", "und", "www"
+})
+
+def search_filter(db: Session, search: str):
+    """Product search condition, served by the FULLTEXT index where there is one"""
+    terms = [t for t in re.findall(r"\w+", search) if t.lower() not in FULLTEXT_STOPWORDS]
+    if (
+        db.get_bind().dialect.name == "mysql"
+        and terms
+        and all(len(t) >= FULLTEXT_MIN_TOKEN for t in terms)
+    ):
+        # Every remaining word must match, each as a word prefix: "head" finds
+        # "headphones" but, unlike the LIKE fallback, "phone" does not find
+        # "smartphone". Searches made only of stopwords or short words use LIKE.
+        return mysql_match(
+            models.Product.name, models.Product.description, models.Product.sku,
+            against=" ".join(f"+{t}*" for t in terms)
+        ).in_boolean_mode()
+    
+    search_pattern = f"%{search}%"
+    return or_(
+        models.Product.name.like(search_pattern),
+        models.Product.description.like(search_pattern),
+        models.Product.sku.like(search_pattern)
+    )
+
+# What the storefront and POS product cards render. Admin listings
+# (include_inactive) and /products/{id} still return the full row.
+LISTING_DESCRIPTION_CHARS = 200
+LISTING_COLUMNS = (
+    models.Product.id,
+    models.Product.name,
+    models.Product.sku,
+    models.Product.category_id,
+    func.substr(models.Product.description, 1, LISTING_DESCRIPTION_CHARS).label("description"),
+    models.Product.mrp,
+    models.Product.selling_price,
+    models.Product.wholesale_price,
+    models.Product.wholesale_min_qty,
+    models.Product.stock_qty,
+    models.Product.images,
+    models.Product.created_at,
+)
+
+def listing_item(row) -> dict:
+    """Listing card for a projected product row, keeping only the cover image"""
+    item = row._asdict()
+    item["images"] = (row.images or [])[:1]
+    return item
+
 @router.get("/")
 def get_products(
     category_id: Optional[str] = None,
@@ -21,11 +87,12 @@ def get_products(
     sort_order: str = "desc",
     page: int = 1,
     limit: int = 20,
+    cursor: Optional[str] = None,
     include_inactive: bool = False,
     db: Session = Depends(get_db)
 ):
     """Get products with filtering and pagination"""
-    query = db.query(models.Product)
+    query = db.query(models.Product) if include_inactive else db.query(*LISTING_COLUMNS)
     
     # Only filter by is_active if include_inactive is False (for public API)
     if not include_inactive:
@@ -41,30 +108,43 @@ def get_products(
         else:
             query = query.filter(models.Product.category_id == category_id)
     if search:
-        search_pattern = f"%{search}%"
-        query = query.filter(
-            or_(
-                models.Product.name.like(search_pattern),
-                models.Product.description.like(search_pattern),
-                models.Product.sku.like(search_pattern)
-            )
-        )
+        query = query.filter(search_filter(db, search))
     if min_price:
         query = query.filter(models.Product.selling_price >= min_price)
     if max_price:
         query = query.filter(models.Product.selling_price <= max_price)
         
+    # Newest-first listings can page by cursor: no COUNT and no OFFSET scan
+    keyset = sort_by == "created_at" and sort_order == "desc"
+    if cursor:
+        if not keyset:
+            raise HTTPException(status_code=400, detail="cursor requires sort_by=created_at&sort_order=desc")
+        products, next_cursor = keyset_page(query, models.Product, cursor, limit)
+        if not include_inactive:
+            products = [listing_item(p) for p in products]
+        return {"products": products, "next_cursor": next_cursor}
+    
     # Sorting
     sort_attr = getattr(models.Product, sort_by, models.Product.created_at)
     if sort_order == "desc":
-        query = query.order_by(desc(sort_attr))
+        query = query.order_by(desc(sort_attr), desc(models.Product.id))
     else:
-        query = query.order_by(asc(sort_attr))
+        query = query.order_by(asc(sort_attr), asc(models.Product.id))
         
-    total = query.count()
+    # Admin listings (include_inactive) stay exact so edits show up at once
+    count_key = (category_id, search, min_price, max_price)
+    total = None if include_inactive else _listing_totals.get(count_key)
+    if total is None:
+        total = query.count()
+        if not include_inactive:
+            _listing_totals.set(count_key, total)
     products = query.offset((page - 1) * limit).limit(limit).all()
     
-    return {"products": products, "total": total, "page": page, "pages": (total + limit - 1) // limit}
+    result = {"total": total, "page": page, "pages": (total + limit - 1) // limit}
+    if keyset and len(products) == limit and page * limit < total:
+        result["next_cursor"] = encode_cursor(products[-1])
+    result["products"] = products if include_inactive else [listing_item(p) for p in products]
+    return result
 
 @router.get("/{product_id}")
 def get_product(product_id: str, db: Session = Depends(get_db)):
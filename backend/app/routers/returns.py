@@ -2,12 +2,16 @@
 Returns management endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
+import asyncio
 
 from app.core.database import get_db
 from app.core.security import get_current_user, admin_required
+from app.core.config import settings
+from app.routers.uploads import save_uploaded_file, delete_uploaded_file
 from app import models
 
 router = APIRouter()
@@ -15,14 +19,18 @@ router = APIRouter()
 @router.get("/")
 def get_user_returns(user: dict = Depends(get_current_user), db: Session = Depends(get_db)):
     """Get current user's return requests"""
-    returns = db.query(models.ReturnRequest).filter(
+    # Order number and date come back with each return through one outer join
+    returns = db.query(
+        models.ReturnRequest, models.Order.order_number, models.Order.created_at
+    ).outerjoin(
+        models.Order, models.ReturnRequest.order_id == models.Order.id
+    ).filter(
         models.ReturnRequest.user_id == user["id"]
     ).order_by(models.ReturnRequest.created_at.desc()).all()
     
     # Enrich with order information
     enriched_returns = []
-    for return_req in returns:
-        order = db.query(models.Order).filter(models.Order.id == return_req.order_id).first()
+    for return_req, order_number, order_date in returns:
         return_dict = {
             "id": return_req.id,
             "order_id": return_req.order_id,
@@ -40,8 +48,8 @@ def get_user_returns(user: dict = Depends(get_current_user), db: Session = Depen
             "courier_provider": return_req.courier_provider,
             "created_at": return_req.created_at,
             "updated_at": return_req.updated_at,
-            "order_number": order.order_number if order else "Unknown",
-            "order_date": order.created_at.isoformat() if order and order.created_at else None
+            "order_number": order_number or "Unknown",
+            "order_date": order_date.isoformat() if order_date else None
         }
         enriched_returns.append(return_dict)
     
@@ -61,26 +69,63 @@ def get_return_by_id(return_id: str, user: dict = Depends(get_current_user), db:
     return return_req
 
 @router.post("/{return_id}/evidence")
-def upload_return_evidence(
+async def upload_return_evidence(
     return_id: str,
     files: List[UploadFile] = File(...),
     user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Upload evidence files for return request"""
-    return_req = db.query(models.ReturnRequest).filter(
-        models.ReturnRequest.id == return_id,
-        models.ReturnRequest.user_id == user["id"]
-    ).first()
+    if len(files) > 5:
+        raise HTTPException(status_code=400, detail="Maximum 5 files allowed")
+    
+    for f in files:
+        if not f.content_type or not f.content_type.startswith(("image/", "video/")):
+            raise HTTPException(status_code=400, detail=f"{f.filename} must be an image or video")
+    
+    return_req = await run_in_threadpool(
+        lambda: db.query(models.ReturnRequest).filter(
+            models.ReturnRequest.id == return_id,
+            models.ReturnRequest.user_id == user["id"]
+        ).first()
+    )
     
     if not return_req:
         raise HTTPException(status_code=404, detail="Return request not found")
     
-    # TODO: Implement file upload logic
-    # For now, just return success
+    # Files are written side by side on the threadpool rather than one after another
+    results = await asyncio.gather(
+        *(
+            run_in_threadpool(
+                save_uploaded_file, f, "evidence", None,
+                settings.MAX_VIDEO_SIZE if f.content_type.startswith("video/") else settings.MAX_FILE_SIZE
+            )
+            for f in files
+        ),
+        return_exceptions=True
+    )
+    
+    errors = [r for r in results if isinstance(r, Exception)]
+    if errors:
+        for r in results:
+            if isinstance(r, str):
+                delete_uploaded_file(r)
+        raise errors[0]
+    
+    images = [url for f, url in zip(files, results) if f.content_type.startswith("image/")]
+    videos = [url for f, url in zip(files, results) if f.content_type.startswith("video/")]
+    
+    def record_evidence():
+        return_req.evidence_images = (return_req.evidence_images or []) + images
+        return_req.evidence_videos = (return_req.evidence_videos or []) + videos
+        return_req.updated_at = datetime.utcnow()
+        db.commit()
+    
+    await run_in_threadpool(record_evidence)
+    
     return {
         "message": f"Uploaded {len(files)} evidence files",
-        "files": [{"filename": f.filename, "url": f"/uploads/evidence/{f.filename}"} for f in files]
+        "files": [{"filename": f.filename, "url": url} for f, url in zip(files, results)]
     }
 
 @router.get("/{return_id}/tracking")
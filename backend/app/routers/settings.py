@@ -7,6 +7,7 @@ from typing import Optional, Dict, Any
 from pydantic import BaseModel
 import logging
 
+from app.core.cache import settings_cache
 from app.core.database import get_db
 from app.core.security import admin_required
 from app import models
@@ -148,6 +149,7 @@ def update_settings(
     settings.configs = configs
     
     db.commit()
+    settings_cache.clear()
     db.refresh(settings)
     
     logger.info(f"Settings updated by admin: {admin['name']}")
@@ -224,6 +226,7 @@ def update_email_settings(
         settings.smtp_password = data.smtp_password
     
     db.commit()
+    settings_cache.clear()
     db.refresh(settings)
     
     logger.info(f"Email settings updated by admin: {admin['name']}")
@@ -282,6 +285,7 @@ def update_sms_settings(
         settings.msg91_template_id = data.msg91_template_id
     
     db.commit()
+    settings_cache.clear()
     db.refresh(settings)
     
     logger.info(f"SMS settings updated by admin: {admin['name']}")
@@ -329,6 +333,11 @@ def test_email(data: dict, db: Session = Depends(get_db), admin: dict = Depends(
 @router.get("/public", include_in_schema=False)
 def get_public_settings(db: Session = Depends(get_db)):
     """Get public settings (no authentication required)"""
+    # Read on every page load; settings writes clear this worker's copy only
+    public = settings_cache.get("public")
+    if public is not None:
+        return public
+    
     settings = get_or_create_settings(db)
     
     # SQLAlchemy already parses JSON fields, no need to json.loads() again
@@ -338,7 +347,7 @@ def get_public_settings(db: Session = Depends(get_db)):
     
     logger.info(f"Settings found - social_links: {social_links}, configs: {configs}")
     
-    return {
+    public = {
         # Basic business info
         "business_name": settings.business_name or "BharatBazaar",
         "company_name": settings.company_name or "BharatBazaar Pvt Ltd",
@@ -371,3 +380,5 @@ def get_public_settings(db: Session = Depends(get_db)):
         "social_links": social_links,
         "configs": configs
     }
+    settings_cache.set("public", public)
+    return public
@@ -2,8 +2,9 @@
 File upload endpoints
 """
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from typing import List, Optional
-import shutil
+import asyncio
 import uuid
 from pathlib import Path
 from PIL import Image
@@ -20,12 +21,26 @@ router = APIRouter()
 UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
 
+COPY_CHUNK_SIZE = 1024 * 1024
+
 def generate_filename(original_filename: str) -> str:
     """Generate unique filename"""
     extension = original_filename.split('.')[-1] if '.' in original_filename else 'jpg'
     return f"{uuid.uuid4()}.{extension}"
 
-def save_uploaded_file(file: UploadFile, folder: str = "general", image_type: str = None) -> str:
+def copy_upload(src, file_path: Path, max_size: Optional[int] = None) -> None:
+    """Write an upload's spooled body to file_path, rejecting bodies over max_size"""
+    with open(file_path, "wb") as buffer:
+        # Large chunks keep the syscall count low; counting while copying
+        # stops an oversized body at the limit
+        copied = 0
+        while chunk := src.read(COPY_CHUNK_SIZE):
+            copied += len(chunk)
+            if max_size is not None and copied > max_size:
+                raise HTTPException(status_code=413, detail="File too large")
+            buffer.write(chunk)
+
+def save_uploaded_file(file: UploadFile, folder: str = "general", image_type: str = None, max_size: Optional[int] = None) -> str:
     """Save uploaded file and return the URL"""
     try:
         # Create folder if it doesn't exist
@@ -37,8 +52,11 @@ def save_uploaded_file(file: UploadFile, folder: str = "general", image_type: st
         file_path = folder_path / unique_filename
         
         # Save file
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        try:
+            copy_upload(file.file, file_path, max_size)
+        except HTTPException:
+            file_path.unlink(missing_ok=True)
+            raise
         
         # Optimize image if it's an image file
         if file.content_type and file.content_type.startswith('image/'):
@@ -47,14 +65,46 @@ def save_uploaded_file(file: UploadFile, folder: str = "general", image_type: st
         # Return URL
         return f"/uploads/{folder}/{unique_filename}"
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to save file: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
 
+# Output sizes of the fixed-size resize branches. JPEGs headed there are
+# decoded by libjpeg at 1/2, 1/4 or 1/8 scale directly from the DCT
+# coefficients, as long as both sides still cover the target (so a square
+# crop still covers it too). logo and general use thumbnail(), which
+# already does this on its own.
+_JPEG_DRAFT_SIZES = {
+    "banner": (1200, 400),
+    "favicon": (32, 32),
+    "category": (500, 500),
+    "product": (800, 800),
+}
+
+def square_resize(img: Image.Image, size: int) -> Image.Image:
+    """Center-crop to a square and scale to size x size in one resample pass"""
+    width, height = img.size
+    side = min(width, height)
+    left = (width - side) // 2
+    top = (height - side) // 2
+    # box= resamples straight from the crop region, with no intermediate cropped copy
+    return img.resize(
+        (size, size),
+        Image.Resampling.LANCZOS,
+        box=(left, top, left + side, top + side),
+        reducing_gap=3.0
+    )
+
 def optimize_image(file_path: Path, image_type: str = "general"):
     """Optimize image size and quality"""
     try:
         with Image.open(file_path) as img:
+            draft_size = _JPEG_DRAFT_SIZES.get(image_type)
+            if draft_size and img.format == "JPEG":
+                img.draft("RGB", draft_size)
+            
             # Convert to RGB if necessary
             if img.mode in ('RGBA', 'LA', 'P'):
                 if image_type in ['logo', 'favicon']:
@@ -63,32 +113,22 @@ def optimize_image(file_path: Path, image_type: str = "general"):
                 else:
                     img = img.convert('RGB')
             
-            # Specific sizing for different image types
+            # Specific sizing for different image types. reducing_gap lets PIL
+            # box-reduce large sources by an integer factor first, so LANCZOS
+            # only runs over an image at most ~3x the target size
             if image_type == 'logo':
-                img.thumbnail((400, 120), Image.Resampling.LANCZOS)
+                img.thumbnail((400, 120), Image.Resampling.LANCZOS, reducing_gap=3.0)
             elif image_type == 'favicon':
                 img = img.resize((32, 32), Image.Resampling.LANCZOS)
             elif image_type == 'banner':
-                img = img.resize((1200, 400), Image.Resampling.LANCZOS)
+                img = img.resize((1200, 400), Image.Resampling.LANCZOS, reducing_gap=3.0)
             elif image_type == 'category':
-                # Make square
-                width, height = img.size
-                size = min(width, height)
-                left = (width - size) // 2
-                top = (height - size) // 2
-                img = img.crop((left, top, left + size, top + size))
-                img = img.resize((500, 500), Image.Resampling.LANCZOS)
+                img = square_resize(img, 500)
             elif image_type == 'product':
-                # Make square
-                width, height = img.size
-                size = min(width, height)
-                left = (width - size) // 2
-                top = (height - size) // 2
-                img = img.crop((left, top, left + size, top + size))
-                img = img.resize((800, 800), Image.Resampling.LANCZOS)
+                img = square_resize(img, 800)
             else:
                 # General: max 1200x1200
-                img.thumbnail((1200, 1200), Image.Resampling.LANCZOS)
+                img.thumbnail((1200, 1200), Image.Resampling.LANCZOS, reducing_gap=3.0)
             
             # Save optimized image
             if img.mode == 'RGBA' and file_path.suffix.lower() in ['.jpg', '.jpeg']:
@@ -125,11 +165,8 @@ def upload_image(
     if not file.content_type or not file.content_type.startswith('image/'):
         raise HTTPException(status_code=400, detail="File must be an image")
     
-    # Check file size (10MB limit)
-    if hasattr(file, 'size') and file.size > settings.MAX_FILE_SIZE:
-        raise HTTPException(status_code=400, detail="File too large")
-    
-    file_url = save_uploaded_file(file, folder, image_type)
+    # Size is enforced while copying (10MB limit)
+    file_url = save_uploaded_file(file, folder, image_type, settings.MAX_FILE_SIZE)
     
     return {
         "message": "Image uploaded and optimized successfully",
@@ -175,7 +212,7 @@ def upload_favicon(
     }
 
 @router.post("/multiple")
-def upload_multiple_images(
+async def upload_multiple_images(
     files: List[UploadFile] = File(...),
     folder: str = "general",
     image_type: Optional[str] = None,
@@ -185,21 +222,25 @@ def upload_multiple_images(
     if len(files) > 10:
         raise HTTPException(status_code=400, detail="Maximum 10 files allowed")
     
+    # Validate file type
+    images = [f for f in files if f.content_type and f.content_type.startswith('image/')]
+    
+    # The request body is already spooled by the time we get here, so the
+    # per-file disk write and PIL work run side by side on the threadpool
+    results = await asyncio.gather(
+        *(run_in_threadpool(save_uploaded_file, file, folder, image_type, settings.MAX_FILE_SIZE) for file in images),
+        return_exceptions=True
+    )
+    
     uploaded_files = []
-    for file in files:
-        # Validate file type
-        if not file.content_type or not file.content_type.startswith('image/'):
-            continue
-        
-        try:
-            file_url = save_uploaded_file(file, folder, image_type)
-            uploaded_files.append({
-                "url": file_url,
-                "filename": file.filename
-            })
-        except Exception as e:
-            logger.error(f"Failed to upload {file.filename}: {str(e)}")
+    for file, result in zip(images, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to upload {file.filename}: {str(result)}")
             continue
+        uploaded_files.append({
+            "url": result,
+            "filename": file.filename
+        })
     
     return {
         "message": f"Uploaded and optimized {len(uploaded_files)} images successfully",
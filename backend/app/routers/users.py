@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 from typing import Dict, Any
 
 from app.core.database import get_db
-from app.core.security import get_current_user, hash_password, verify_password
+from app.core.security import get_current_user, hash_password, verify_password, invalidate_user
 from app.schemas.user import UserAddressUpdate, ChangePassword, UpdatePhone
 from app import models
 
@@ -31,6 +31,7 @@ def update_profile(data: dict, user: dict = Depends(get_current_user), db: Sessi
     
     if updated_fields:
         db.commit()
+        invalidate_user(user["id"])
     
     return {"message": "Profile updated successfully", "updated_fields": updated_fields}
 
@@ -44,6 +45,7 @@ def change_password(data: ChangePassword, user: dict = Depends(get_current_user)
     
     user_obj.password = hash_password(data.new_password)
     db.commit()
+    invalidate_user(user["id"])
     
     return {"message": "Password changed successfully"}
 
@@ -57,5 +59,6 @@ def update_addresses(data: UserAddressUpdate, user: dict = Depends(get_current_u
     
     db_user.addresses = data.addresses
     db.commit()
+    invalidate_user(user["id"])
     
     return {"message": "Addresses updated successfully"}
\ No newline at end of file
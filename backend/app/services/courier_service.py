@@ -281,7 +281,7 @@ class DelhiveryService:
 
             url = f"{self.BASE_URL}/api/v1/packages/json/"
             params = {"waybill": awb, "token": self.token}
-            response = requests.get(url, params=params)
+            response = requests.get(url, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -405,7 +405,7 @@ class DelhiveryService:
             headers.pop("Content-Type", None)
             
             logger.info(f"Creating return shipment for order {return_data['original_order_id']}")
-            response = requests.post(url, headers=headers, data=data_param)
+            response = requests.post(url, headers=headers, data=data_param, timeout=30)
             
             if response.status_code == 200:
                 data = response.json()
@@ -449,7 +449,7 @@ class DelhiveryService:
         try:
             url = f"{self.BASE_URL}/api/p/packing_slip"
             params = {"wbns": awb, "pdf": "true"} 
-            response = requests.get(url, headers=self.headers, params=params)
+            response = requests.get(url, headers=self.headers, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -475,7 +475,7 @@ class DelhiveryService:
         try:
             url = f"{self.BASE_URL}/api/p/packing_slip"
             params = {"wbns": awb, "pdf": "true", "invoice": "true"}
-            response = requests.get(url, headers=self.headers, params=params)
+            response = requests.get(url, headers=self.headers, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -498,7 +498,7 @@ class DelhiveryService:
                 "cancellation": "true"
             }
             
-            response = requests.post(url, headers=self.headers, json=payload)
+            response = requests.post(url, headers=self.headers, json=payload, timeout=30)
             
             if response.status_code == 200:
                 return {
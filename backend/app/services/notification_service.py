@@ -0,0 +1,48 @@
+"""
+Notification service - unread counters shared by user and admin endpoints
+"""
+from sqlalchemy import exists
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app import models
+
+# Unread badge counts, polled on every page load. Writes drop the affected
+# key; the short TTL bounds staleness across workers, which don't share it.
+_unread_counts = TTLCache(maxsize=10000, ttl=30)
+
+class NotificationService:
+    """Notification helpers shared across routers"""
+    
+    @staticmethod
+    def feed_filter(user_id: str):
+        """Filter selecting a user's own feed"""
+        return [models.Notification.user_id == user_id, models.Notification.for_admin == False]
+    
+    @staticmethod
+    def unread_count(db: Session, user_id: str) -> int:
+        """Unread notifications in a user's feed, served from cache when possible"""
+        count = _unread_counts.get(user_id)
+        if count is None:
+            count = db.query(models.Notification).filter(
+                *NotificationService.feed_filter(user_id),
+                models.Notification.read == False
+            ).count()
+            _unread_counts.set(user_id, count)
+        return count
+    
+    @staticmethod
+    def has_unread(db: Session, user_id: str) -> bool:
+        """Whether a user has any unread notification; EXISTS stops at the first match"""
+        count = _unread_counts.get(user_id)
+        if count is not None:
+            return count > 0
+        return db.query(exists().where(
+            *NotificationService.feed_filter(user_id),
+            models.Notification.read == False
+        )).scalar()
+    
+    @staticmethod
+    def invalidate(user_id: str) -> None:
+        """Drop a user's cached unread count after their notifications change"""
+        _unread_counts.pop(user_id)
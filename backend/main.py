@@ -1,16 +1,19 @@
 """
 FastAPI Main Application Entry Point
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import Depends, HTTPException
 from sqlalchemy.orm import Session
 from pathlib import Path
+import anyio
+import json
 import logging
 
 from app.core.config import settings
-from app.core.database import engine, get_db
+from app.core.database import get_db
 from app import models
 from app.routers import auth, users, products, categories, orders, admin, uploads, notifications, banners, offers, utils, settings as settings_router, courier, pages, returns
 
@@ -26,6 +29,7 @@ def create_application() -> FastAPI:
         version=settings.VERSION,
         description="BharatBazaar E-commerce API",
         openapi_url=f"{settings.API_V1_STR}/openapi.json" if settings.ENVIRONMENT != "production" else None,
+        default_response_class=ORJSONResponse,
     )
 
     # Set up CORS
@@ -36,14 +40,17 @@ def create_application() -> FastAPI:
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
     # Create uploads directory
     UPLOAD_DIR = Path("uploads")
     UPLOAD_DIR.mkdir(exist_ok=True)
 
-    # Mount static files for serving uploaded images
-    app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+    # Mount static files for serving uploaded images, unless the proxy in
+    # front of the app serves them straight from disk
+    if settings.SERVE_UPLOADS:
+        app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 
     # Include API routers
     app.include_router(auth.router, prefix=f"{settings.API_V1_STR}/auth", tags=["authentication"])
@@ -102,36 +109,52 @@ def create_application() -> FastAPI:
             "order_number": data.get("order_number", "")
         }
 
-    # Create database tables
-    models.Base.metadata.create_all(bind=engine)
+    @app.on_event("startup")
+    async def configure_threadpool():
+        """Size the threadpool that runs sync endpoints and their DB calls"""
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        limiter.total_tokens = settings.THREADPOOL_SIZE
 
-    # Initialize data
-    from app.core.init_db import init_db
-    init_db()
+    @app.on_event("startup")
+    def initialize_database():
+        """Create tables and default data once the worker starts serving"""
+        from app.core.init_db import init_db
+        init_db()
 
     return app
 
 app = create_application()
 
+# Root and health bodies never change while the process runs, so they are
+# encoded once. A fresh Response is still built per request because
+# middleware (CORS) appends to the response's header list.
+_ROOT_BODY = json.dumps({
+    "message": "BharatBazaar API",
+    "version": settings.VERSION,
+    "environment": settings.ENVIRONMENT
+}).encode()
+_HEALTH_BODY = b'{"status": "healthy"}'
+
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "BharatBazaar API",
-        "version": settings.VERSION,
-        "environment": settings.ENVIRONMENT
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 if __name__ == "__main__":
+    import os
     import uvicorn
+    reload = settings.ENVIRONMENT == "development"
+    # uvicorn[standard] ships uvloop and httptools; the default "auto"
+    # loop/http settings pick them up wherever they are installed
     uvicorn.run(
         "main:app",
         host="127.0.0.1",
         port=settings.PORT,
-        reload=settings.ENVIRONMENT == "development"
+        reload=reload,
+        workers=None if reload else (settings.WEB_CONCURRENCY or os.cpu_count())
     )
\ No newline at end of file
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Database migration to make otps.phone unique
+send-otp now upserts on the phone number, which needs a unique index to conflict on
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import inspect, text, Index
+from app.core.database import engine
+from app import models
+
+def run_migration():
+    """Run the unique OTP phone migration"""
+    print("Starting unique OTP phone migration...")
+    
+    try:
+        with engine.begin() as conn:
+            indexes = {ix["name"]: ix for ix in inspect(conn).get_indexes("otps")}
+            existing = indexes.get("ix_otps_phone")
+            if existing and existing["unique"]:
+                print("✓ ix_otps_phone is already unique")
+                return
+            
+            # Keep only the newest OTP row per phone
+            result = conn.execute(text("""
+                DELETE FROM otps
+                WHERE id NOT IN (SELECT id FROM (SELECT MAX(id) AS id FROM otps GROUP BY phone) AS latest)
+            """))
+            print(f"✓ Removed {result.rowcount} duplicate OTP rows")
+            
+            if existing:
+                Index("ix_otps_phone", models.OTP.__table__.c.phone).drop(conn)
+                print("✓ Dropped non-unique ix_otps_phone")
+            
+            Index("ix_otps_phone", models.OTP.__table__.c.phone, unique=True).create(conn)
+            print("✓ Created unique ix_otps_phone")
+        
+        print("Migration completed successfully!")
+        
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Database migration to add the FULLTEXT product search index (MySQL only)
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import inspect
+from app.core.database import engine
+from app import models
+
+def run_migration():
+    """Run the product search index migration"""
+    print("Starting product search index migration...")
+    
+    if engine.dialect.name != "mysql":
+        print("✓ Not MySQL, search keeps using LIKE; nothing to do")
+        return
+    
+    try:
+        with engine.begin() as conn:
+            existing = {ix["name"] for ix in inspect(conn).get_indexes("products")}
+            if "ix_products_search" in existing:
+                print("✓ ix_products_search already exists")
+            else:
+                index = next(ix for ix in models.Product.__table__.indexes if ix.name == "ix_products_search")
+                index.create(conn)
+                print("✓ Created ix_products_search")
+        
+        print("Migration completed successfully!")
+        
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    run_migration()
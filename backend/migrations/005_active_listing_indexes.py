@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Database migration to add active-row indexes on banners, categories and products
+Partial indexes on SQLite/PostgreSQL, is_active-led composites on MySQL
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import inspect
+from app.core.database import engine
+from app import models
+
+INDEXES = {
+    models.Banner: "ix_banners_active_position",
+    models.Category: "ix_categories_active_parent",
+    models.Product: "ix_products_active_category_created",
+}
+
+def run_migration():
+    """Run the active listing index migration"""
+    print("Starting active listing index migration...")
+    
+    try:
+        with engine.begin() as conn:
+            for model, name in INDEXES.items():
+                table = model.__table__
+                if name in {ix["name"] for ix in inspect(conn).get_indexes(table.name)}:
+                    print(f"✓ {name} already exists")
+                    continue
+                # Each name has one definition per dialect family; ddl_if
+                # skips the ones that don't apply to this engine
+                for index in table.indexes:
+                    if index.name == name:
+                        index.create(conn)
+                print(f"✓ Created {name}")
+        
+        print("Migration completed successfully!")
+        
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    run_migration()
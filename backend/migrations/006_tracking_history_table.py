@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Database migration to add the tracking_history table
+Order status changes are stored as rows instead of appended to orders.tracking_history JSON
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import inspect
+from app.core.database import engine
+from app import models
+
+def run_migration():
+    """Run the tracking history migration"""
+    print("Starting tracking history migration...")
+    
+    try:
+        if inspect(engine).has_table("tracking_history"):
+            print("✓ tracking_history table already exists")
+        else:
+            models.TrackingHistory.__table__.create(engine)
+            print("✓ Created tracking_history table")
+        
+        print("Migration completed successfully!")
+        
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    run_migration()
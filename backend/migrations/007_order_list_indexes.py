@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Database migration to add indexes for cursor-paginated admin order lists
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import inspect
+from app.core.database import engine
+from app import models
+
+def run_migration():
+    """Run the order list index migration"""
+    print("Starting order list index migration...")
+    
+    try:
+        with engine.begin() as conn:
+            existing = {ix["name"] for ix in inspect(conn).get_indexes("orders")}
+            for index in models.Order.__table__.indexes:
+                if index.name in existing:
+                    print(f"✓ {index.name} already exists")
+                    continue
+                index.create(conn)
+                print(f"✓ Created {index.name}")
+        
+        print("Migration completed successfully!")
+        
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    run_migration()
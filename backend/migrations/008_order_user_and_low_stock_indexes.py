@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Database migration to add the per-user order list index and the low-stock product index
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import inspect
+from app.core.database import engine
+from app import models
+
+INDEXES = {
+    models.Order: "ix_orders_user_created",
+    models.Product: "ix_products_low_stock",
+}
+
+def run_migration():
+    """Run the order user and low stock index migration"""
+    print("Starting order user and low stock index migration...")
+    
+    try:
+        with engine.begin() as conn:
+            for model, name in INDEXES.items():
+                table = model.__table__
+                if name in {ix["name"] for ix in inspect(conn).get_indexes(table.name)}:
+                    print(f"✓ {name} already exists")
+                    continue
+                # ix_products_low_stock is partial, so ddl_if skips it on MySQL
+                for index in table.indexes:
+                    if index.name == name:
+                        index.create(conn)
+                print(f"✓ Created {name}")
+        
+        print("Migration completed successfully!")
+        
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    run_migration()
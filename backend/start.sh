@@ -13,7 +13,7 @@ if [ "$ENVIRONMENT" = "production" ]; then
     # Use Gunicorn for production
     exec gunicorn main:app \
         --bind 0.0.0.0:8000 \
-        --workers 4 \
+        --workers "${WEB_CONCURRENCY:-$(nproc)}" \
         --worker-class uvicorn.workers.UvicornWorker \
         --timeout 120 \
         --keep-alive 2 \
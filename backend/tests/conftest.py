@@ -0,0 +1,38 @@
+"""
+Shared pytest fixtures
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import models
+
+@pytest.fixture
+def db():
+    """Session on a fresh in-memory SQLite database with every table created"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    models.Base.metadata.create_all(engine)
+    session = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+@pytest.fixture
+def customer(db):
+    """A stored customer account"""
+    user = models.User(phone="9000000001", name="Asha", email="asha@example.com", password="x", addresses=[])
+    db.add(user)
+    db.commit()
+    return user
+
+@pytest.fixture
+def current_user(customer):
+    """The customer as endpoints receive it from get_current_user"""
+    return {"id": customer.id, "name": customer.name, "phone": customer.phone, "role": customer.role}
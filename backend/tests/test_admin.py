@@ -0,0 +1,118 @@
+"""
+Admin endpoint tests
+"""
+import pytest
+from fastapi import HTTPException, Response
+
+from app import models
+from app.routers import admin
+
+ADMIN = {"id": "admin", "name": "Admin", "role": "admin"}
+
+def product_row(sku, barcode=None, **fields):
+    return admin.ProductCreate(
+        name=fields.pop("name", sku), sku=sku, barcode=barcode,
+        mrp=100, selling_price=90, cost_price=50, **fields
+    )
+
+def counts(db):
+    return (
+        db.query(models.Category).count(),
+        db.query(models.Product).count(),
+        db.query(models.Banner).count(),
+    )
+
+def test_seed_data_creates_samples_once(db):
+    first = admin.seed_data(admin=ADMIN, db=db)
+    assert first["message"] == "Sample data created successfully"
+    assert first["skipped"] == []
+    assert counts(db) == (3, 5, 3)
+    
+    second = admin.seed_data(admin=ADMIN, db=db)
+    assert second["message"] == "Sample data already exists"
+    assert counts(db) == (3, 5, 3)
+
+def test_seed_data_reuses_existing_categories(db):
+    db.add(models.Category(name="Electronics", description="Existing"))
+    db.commit()
+    
+    admin.seed_data(admin=ADMIN, db=db)
+    
+    assert db.query(models.Category).filter(models.Category.name == "Electronics").count() == 1
+    assert counts(db) == (3, 5, 3)
+    electronics_id = db.query(models.Category.id).filter(models.Category.name == "Electronics").scalar()
+    assert db.query(models.Product).filter(models.Product.category_id == electronics_id).count() == 2
+
+def test_partial_seed_is_completed_without_duplicates(db):
+    admin.seed_data(admin=ADMIN, db=db)
+    db.query(models.Banner).delete()
+    db.query(models.Product).filter(models.Product.sku == "SAMPLE-TSH-001").update({"stock_qty": 1})
+    db.commit()
+    
+    result = admin.seed_data(admin=ADMIN, db=db)
+    
+    assert result["banners"] == 3
+    assert counts(db) == (3, 5, 3)
+    stock = db.query(models.Product.stock_qty).filter(models.Product.sku == "SAMPLE-TSH-001").scalar()
+    assert stock == 200
+
+def test_bulk_upload_creates_and_updates_by_sku(db):
+    admin.bulk_upload_products([product_row("SKU-1", "BC-1")], admin=ADMIN, db=db)
+    
+    result = admin.bulk_upload_products(
+        [product_row("SKU-1", "BC-1", stock_qty=7), product_row("SKU-2", "BC-2")], admin=ADMIN, db=db
+    )
+    
+    assert (result["created"], result["updated"]) == (1, 1)
+    assert db.query(models.Product.stock_qty).filter(models.Product.sku == "SKU-1").scalar() == 7
+
+def test_bulk_upload_rejects_barcode_of_another_product(db):
+    admin.bulk_upload_products([product_row("SKU-1", "BC-1", name="Original")], admin=ADMIN, db=db)
+    
+    with pytest.raises(HTTPException) as exc:
+        admin.bulk_upload_products([product_row("SKU-2", "BC-1", name="Intruder")], admin=ADMIN, db=db)
+    
+    assert exc.value.status_code == 400
+    assert "SKU-2" in exc.value.detail
+    original = db.query(models.Product.sku, models.Product.name).filter(models.Product.barcode == "BC-1").one()
+    assert tuple(original) == ("SKU-1", "Original")
+    assert db.query(models.Product).count() == 1
+
+def test_bulk_upload_rejects_barcode_repeated_across_skus(db):
+    with pytest.raises(HTTPException) as exc:
+        admin.bulk_upload_products([product_row("SKU-1", "BC-1"), product_row("SKU-2", "BC-1")], admin=ADMIN, db=db)
+    
+    assert exc.value.status_code == 400
+    assert db.query(models.Product).count() == 0
+
+def test_seller_requests_stay_a_plain_list(db):
+    for name in ("A", "B", "C"):
+        db.add(models.SellerRequest(business_name=name))
+    db.commit()
+    
+    response = Response()
+    everything = admin.get_seller_requests(response, status=None, cursor=None, limit=None, admin=ADMIN, db=db)
+    assert len(everything) == 3
+    assert "X-Next-Cursor" not in response.headers
+    
+    first = Response()
+    page = admin.get_seller_requests(first, status=None, cursor=None, limit=2, admin=ADMIN, db=db)
+    rest = admin.get_seller_requests(
+        Response(), status=None, cursor=first.headers["X-Next-Cursor"], limit=2, admin=ADMIN, db=db
+    )
+    assert [r.id for r in page + rest] == [r.id for r in everything]
+
+def test_admin_notifications_are_per_admin(db):
+    other = {"id": "other-admin", "name": "Other", "role": "admin"}
+    mine = models.Notification(type="info", title="t", message="m", user_id=ADMIN["id"])
+    theirs = models.Notification(type="info", title="t", message="m", user_id=other["id"])
+    db.add_all([mine, theirs])
+    db.commit()
+    
+    admin.mark_notification_read(mine.id, admin=ADMIN, db=db)
+    
+    with pytest.raises(HTTPException):
+        admin.mark_notification_read(theirs.id, admin=ADMIN, db=db)
+    listed = admin.get_admin_notifications(cursor=None, limit=50, admin=other, db=db)
+    assert [n.id for n in listed["notifications"]] == [theirs.id]
+    assert listed["unread_count"] == 1
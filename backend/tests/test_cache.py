@@ -0,0 +1,68 @@
+"""
+TTLCache tests
+"""
+import pytest
+
+from app.core.cache import TTLCache
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable stand-in for time.monotonic as seen by the cache"""
+    now = [1000.0]
+    monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now[0])
+    return now
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLCache(maxsize=10, ttl=30)
+    cache.set("a", 1)
+    
+    clock[0] += 29
+    assert cache.get("a") == 1
+    
+    clock[0] += 1
+    assert cache.get("a") is None
+    assert cache.get("a", "missing") == "missing"
+
+def test_per_entry_ttl_overrides_default(clock):
+    cache = TTLCache(maxsize=10, ttl=30)
+    cache.set("short", 1, ttl=5)
+    cache.set("long", 2)
+    
+    clock[0] += 6
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = TTLCache(maxsize=2, ttl=30)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", 3)
+    
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+def test_overwriting_a_key_does_not_evict(clock):
+    cache = TTLCache(maxsize=2, ttl=30)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 3)
+    
+    assert cache.get("a") == 3
+    assert cache.get("b") == 2
+
+def test_pop_pop_where_and_clear(clock):
+    cache = TTLCache(maxsize=10, ttl=30)
+    for key, owner in (("t1", "u1"), ("t2", "u1"), ("t3", "u2")):
+        cache.set(key, {"id": owner})
+    
+    assert cache.pop("t3") == {"id": "u2"}
+    assert cache.pop("t3", "gone") == "gone"
+    
+    cache.pop_where(lambda value: value["id"] == "u1")
+    assert cache.get("t1") is None and cache.get("t2") is None
+    
+    cache.set("t4", {"id": "u3"})
+    cache.clear()
+    assert cache.get("t4") is None
@@ -0,0 +1,66 @@
+"""
+Courier tracking cache tests
+"""
+import pytest
+
+from app.core.cache import tracking_cache
+from app.routers import courier
+from app.services.courier_service import DelhiveryService
+
+LIVE_RESULT = {"success": True, "awb": "123", "status": "In Transit", "tracking_history": []}
+
+@pytest.fixture(autouse=True)
+def clear_tracking_cache():
+    tracking_cache.clear()
+    yield
+    tracking_cache.clear()
+
+def stub_track_order(monkeypatch, result):
+    """Replace the Delhivery call with one that records each AWB it is asked for"""
+    calls = []
+    def track_order(self, awb):
+        calls.append(awb)
+        return dict(result, awb=awb)
+    monkeypatch.setattr(DelhiveryService, "track_order", track_order)
+    return calls
+
+def test_second_lookup_is_served_from_cache(monkeypatch):
+    calls = stub_track_order(monkeypatch, LIVE_RESULT)
+    
+    first = courier.track_by_awb("123", db=None)
+    second = courier.track_by_awb("123", db=None)
+    
+    assert calls == ["123"]
+    assert first == second
+    assert "note" not in second
+
+def test_cache_is_keyed_by_awb(monkeypatch):
+    calls = stub_track_order(monkeypatch, LIVE_RESULT)
+    
+    courier.cached_tracking("123")
+    courier.cached_tracking("456")
+    courier.cached_tracking("123")
+    
+    assert calls == ["123", "456"]
+
+def test_entries_expire_after_ttl(monkeypatch):
+    calls = stub_track_order(monkeypatch, LIVE_RESULT)
+    now = [1000.0]
+    monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now[0])
+    
+    courier.cached_tracking("123")
+    now[0] += tracking_cache.ttl - 1
+    courier.cached_tracking("123")
+    assert calls == ["123"]
+    
+    now[0] += 2
+    courier.cached_tracking("123")
+    assert calls == ["123", "123"]
+
+def test_mock_fallbacks_are_not_cached(monkeypatch):
+    calls = stub_track_order(monkeypatch, dict(LIVE_RESULT, note="Mock data - API returned 500"))
+    
+    courier.cached_tracking("123")
+    courier.cached_tracking("123")
+    
+    assert calls == ["123", "123"]
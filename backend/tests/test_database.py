@@ -0,0 +1,50 @@
+"""
+upsert() tests on SQLite
+"""
+from datetime import datetime
+
+from app import models
+from app.core.database import upsert
+
+def otp_row(phone, otp, verified=False):
+    return {"phone": phone, "otp": otp, "expiry": datetime(2024, 1, 1), "verified": verified}
+
+def test_inserts_new_rows(db):
+    upsert(db, models.OTP, [otp_row("9000000001", "111111"), otp_row("9000000002", "222222")],
+           index_elements=["phone"], update_columns=["otp", "expiry", "verified"])
+    db.commit()
+    
+    assert {(o.phone, o.otp) for o in db.query(models.OTP)} == {
+        ("9000000001", "111111"), ("9000000002", "222222")
+    }
+
+def test_updates_rows_on_conflict_without_duplicating(db):
+    upsert(db, models.OTP, [otp_row("9000000001", "111111", verified=True)],
+           index_elements=["phone"], update_columns=["otp", "expiry", "verified"])
+    db.commit()
+    
+    upsert(db, models.OTP, [otp_row("9000000001", "333333"), otp_row("9000000002", "222222")],
+           index_elements=["phone"], update_columns=["otp", "expiry", "verified"])
+    db.commit()
+    
+    rows = {o.phone: o for o in db.query(models.OTP).populate_existing()}
+    assert len(rows) == 2
+    assert rows["9000000001"].otp == "333333"
+    assert rows["9000000001"].verified is False
+
+def test_only_update_columns_change(db):
+    upsert(db, models.OTP, [otp_row("9000000001", "111111", verified=True)],
+           index_elements=["phone"], update_columns=["otp", "expiry", "verified"])
+    db.commit()
+    
+    upsert(db, models.OTP, [otp_row("9000000001", "444444")],
+           index_elements=["phone"], update_columns=["otp"])
+    db.commit()
+    
+    otp = db.query(models.OTP).populate_existing().one()
+    assert otp.otp == "444444"
+    assert otp.verified is True
+
+def test_empty_rows_is_a_no_op(db):
+    upsert(db, models.OTP, [], index_elements=["phone"], update_columns=["otp"])
+    assert db.query(models.OTP).count() == 0
@@ -0,0 +1,111 @@
+"""
+Notification endpoint tests
+"""
+import pytest
+from fastapi import HTTPException
+
+from app import models
+from app.routers import notifications
+from app.services import notification_service
+
+@pytest.fixture(autouse=True)
+def clear_unread_counts():
+    notification_service._unread_counts.clear()
+    yield
+    notification_service._unread_counts.clear()
+
+def notify(db, user_id=None, read=False, for_admin=False, title="Hello"):
+    notification = models.Notification(
+        type="info", title=title, message="m", user_id=user_id, read=read, for_admin=for_admin
+    )
+    db.add(notification)
+    db.commit()
+    return notification
+
+@pytest.fixture
+def other_user(db):
+    user = models.User(phone="9000000002", name="Ravi", password="x")
+    db.add(user)
+    db.commit()
+    return user
+
+def test_list_returns_only_the_users_feed(db, current_user, other_user):
+    mine = notify(db, current_user["id"])
+    notify(db, current_user["id"], read=True)
+    notify(db, other_user.id)
+    notify(db, for_admin=True)
+    
+    result = notifications.get_user_notifications(cursor=None, limit=50, user=current_user, db=db)
+    
+    assert len(result["notifications"]) == 2
+    assert mine.id in {n.id for n in result["notifications"]}
+    assert all(n.user_id == current_user["id"] for n in result["notifications"])
+    assert result["unread_count"] == 1
+    assert result["next_cursor"] is None
+
+def test_unread_count_is_cached_per_feed(db, current_user):
+    assert notifications.get_unread_notification_count(user=current_user, db=db) == {"unread_count": 0}
+    
+    notify(db, current_user["id"])
+    notify(db, current_user["id"])
+    # Rows written behind the cache's back are only seen once the entry is dropped
+    assert notifications.get_unread_notification_count(user=current_user, db=db) == {"unread_count": 0}
+    notification_service.NotificationService.invalidate(current_user["id"])
+    assert notifications.get_unread_notification_count(user=current_user, db=db) == {"unread_count": 2}
+
+def test_list_pages_by_cursor(db, current_user):
+    for i in range(3):
+        notify(db, current_user["id"], title=f"n{i}")
+    
+    first = notifications.get_user_notifications(cursor=None, limit=2, user=current_user, db=db)
+    second = notifications.get_user_notifications(cursor=first["next_cursor"], limit=2, user=current_user, db=db)
+    
+    assert len(first["notifications"]) == 2
+    assert len(second["notifications"]) == 1
+    assert second["next_cursor"] is None
+
+def test_mark_read_updates_the_cached_count(db, current_user):
+    first = notify(db, current_user["id"])
+    notify(db, current_user["id"])
+    assert notifications.get_unread_notification_count(user=current_user, db=db)["unread_count"] == 2
+    
+    notifications.mark_notification_read(first.id, user=current_user, db=db)
+    
+    assert notifications.get_unread_notification_count(user=current_user, db=db)["unread_count"] == 1
+
+def test_mark_read_rejects_other_users_notifications(db, current_user, other_user):
+    theirs = notify(db, other_user.id)
+    
+    with pytest.raises(HTTPException) as exc:
+        notifications.mark_notification_read(theirs.id, user=current_user, db=db)
+    assert exc.value.status_code == 404
+    
+    with pytest.raises(HTTPException) as exc:
+        notifications.mark_notification_read("missing", user=current_user, db=db)
+    assert exc.value.status_code == 404
+
+def test_has_unread(db, current_user):
+    assert notifications.has_unread_notifications(user=current_user, db=db) == {"has_unread": False}
+    
+    notify(db, current_user["id"])
+    assert notifications.has_unread_notifications(user=current_user, db=db) == {"has_unread": True}
+
+def test_has_unread_answers_from_a_cached_count(db, current_user):
+    notify(db, current_user["id"])
+    notifications.get_unread_notification_count(user=current_user, db=db)
+    notifications.mark_all_notifications_read(user=current_user, db=db)
+    notifications.get_unread_notification_count(user=current_user, db=db)
+    
+    assert notifications.has_unread_notifications(user=current_user, db=db) == {"has_unread": False}
+
+def test_mark_all_read_only_touches_unread_rows_in_the_feed(db, current_user, other_user):
+    notify(db, current_user["id"])
+    notify(db, current_user["id"])
+    notify(db, current_user["id"], read=True)
+    theirs = notify(db, other_user.id)
+    
+    result = notifications.mark_all_notifications_read(user=current_user, db=db)
+    
+    assert result["updated"] == 2
+    assert notifications.get_unread_notification_count(user=current_user, db=db)["unread_count"] == 0
+    assert db.query(models.Notification.read).filter(models.Notification.id == theirs.id).scalar() is False
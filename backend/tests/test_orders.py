@@ -0,0 +1,114 @@
+"""
+Order endpoint tests
+"""
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import update
+
+from app import models
+from app.core import security
+from app.core.security import create_access_token
+from app.routers import orders
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    security._token_users.clear()
+    yield
+    security._token_users.clear()
+
+def make_product(db, sku="SKU-1", stock_qty=5, **fields):
+    product = models.Product(
+        name=fields.pop("name", "Headphones"), sku=sku, mrp=1000, selling_price=800,
+        cost_price=500, stock_qty=stock_qty, gst_rate=18.0, images=[], **fields
+    )
+    db.add(product)
+    db.commit()
+    return product
+
+def place_order(db, customer, *lines):
+    """Call create_order as an authenticated customer would"""
+    token = create_access_token(customer.id, customer.role)
+    request = SimpleNamespace(headers={"Authorization": f"Bearer {token}"})
+    data = orders.OrderCreate(
+        items=[orders.CartItem(product_id=pid, quantity=qty) for pid, qty in lines],
+        shipping_address={"name": "Asha", "pincode": "302001"}
+    )
+    return orders.create_order(data, request, db=db)
+
+def stock_of(db, product):
+    return db.query(models.Product.stock_qty).filter(models.Product.id == product.id).scalar()
+
+def make_order(db, user, **fields):
+    order = models.Order(
+        order_number=fields.pop("order_number", "ORD-1"),
+        user_id=user["id"],
+        items=fields.pop("items", []),
+        subtotal=100,
+        grand_total=100,
+        shipping_address={"name": "Asha"},
+        payment_method="cod",
+        **fields
+    )
+    db.add(order)
+    db.commit()
+    return order
+
+def test_order_detail_merges_cancellation_into_history(db, current_user):
+    user = current_user
+    legacy = {"status": "pending", "timestamp": "2024-01-01T00:00:00", "notes": "Order placed"}
+    order = make_order(db, user, tracking_history=[legacy])
+    
+    orders.cancel_order(order.id, orders.OrderCancellationRequest(reason="Changed my mind"), user=user, db=db)
+    detail = orders.get_order_by_id(order.id, user=user, db=db)
+    
+    assert detail["status"] == "cancelled"
+    assert [entry["status"] for entry in detail["tracking_history"]] == ["pending", "cancelled"]
+    assert detail["tracking_history"][1]["notes"] == "Order cancelled: Changed my mind"
+
+def test_create_order_decrements_stock_per_product(db, customer):
+    headphones = make_product(db, "SKU-1", stock_qty=5)
+    watch = make_product(db, "SKU-2", stock_qty=3, name="Watch")
+    
+    order = place_order(db, customer, (headphones.id, 2), (watch.id, 1), (headphones.id, 1))
+    
+    assert stock_of(db, headphones) == 2
+    assert stock_of(db, watch) == 2
+    assert [item["quantity"] for item in order.items] == [2, 1, 1]
+    assert db.query(models.Order).count() == 1
+
+def test_repeated_lines_are_checked_against_stock_together(db, customer):
+    headphones = make_product(db, stock_qty=3)
+    
+    with pytest.raises(HTTPException) as exc:
+        place_order(db, customer, (headphones.id, 2), (headphones.id, 2))
+    
+    assert exc.value.status_code == 400
+    assert stock_of(db, headphones) == 3
+    assert db.query(models.Order).count() == 0
+
+def test_guarded_decrement_rejects_stock_sold_meanwhile(db, customer):
+    headphones = make_product(db, stock_qty=5)
+    watch = make_product(db, "SKU-2", stock_qty=5, name="Watch")
+    # Another checkout takes the last units after this session loaded the
+    # product: the loaded object still says 5, the row says 0
+    products = models.Product.__table__
+    db.execute(update(products).where(products.c.id == headphones.id).values(stock_qty=0))
+    db.commit()
+    assert headphones.stock_qty == 5
+    
+    with pytest.raises(HTTPException) as exc:
+        place_order(db, customer, (watch.id, 1), (headphones.id, 1))
+    
+    assert exc.value.status_code == 400
+    assert "Headphones" in exc.value.detail
+    # The watch decrement earlier in the same transaction is rolled back too
+    assert stock_of(db, watch) == 5
+    assert stock_of(db, headphones) == 0
+    assert db.query(models.Order).count() == 0
+
+def test_unknown_product_is_rejected(db, customer):
+    with pytest.raises(HTTPException) as exc:
+        place_order(db, customer, ("missing", 1))
+    assert exc.value.status_code == 400
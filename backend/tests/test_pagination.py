@@ -0,0 +1,56 @@
+"""
+Keyset pagination tests
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app import models
+from app.core.pagination import decode_cursor, encode_cursor, keyset_page
+
+def add_notifications(db, user_id, count):
+    """Notifications where pairs share a created_at, so the id tie-break is exercised"""
+    start = datetime(2024, 1, 1)
+    rows = [
+        models.Notification(
+            id=f"n{i:02d}", type="info", title="t", message="m",
+            user_id=user_id, created_at=start + timedelta(minutes=i // 2)
+        )
+        for i in range(count)
+    ]
+    db.add_all(rows)
+    db.commit()
+
+def test_pages_walk_every_row_once_in_order(db, customer):
+    add_notifications(db, customer.id, 7)
+    query = db.query(models.Notification)
+    expected = [
+        n.id for n in query.order_by(models.Notification.created_at.desc(), models.Notification.id.desc())
+    ]
+    
+    seen, cursor = [], None
+    while True:
+        rows, cursor = keyset_page(query, models.Notification, cursor, 3)
+        seen.extend(row.id for row in rows)
+        if cursor is None:
+            break
+    
+    assert seen == expected
+    assert len(seen) == 7
+
+def test_last_full_page_has_no_next_cursor(db, customer):
+    add_notifications(db, customer.id, 4)
+    rows, cursor = keyset_page(db.query(models.Notification), models.Notification, None, 4)
+    assert len(rows) == 4
+    assert cursor is None
+
+def test_cursor_round_trips(db, customer):
+    add_notifications(db, customer.id, 1)
+    row = db.query(models.Notification).one()
+    assert decode_cursor(encode_cursor(row)) == (row.created_at, row.id)
+
+def test_invalid_cursor_is_rejected(db):
+    with pytest.raises(HTTPException) as exc:
+        keyset_page(db.query(models.Notification), models.Notification, "not-a-cursor", 10)
+    assert exc.value.status_code == 400
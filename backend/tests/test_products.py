@@ -0,0 +1,41 @@
+"""
+Product search filter tests
+"""
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import mysql
+
+from app.routers.products import search_filter
+
+def bind_for(dialect_name):
+    """Stand-in session exposing only the dialect name search_filter checks"""
+    bind = SimpleNamespace(dialect=SimpleNamespace(name=dialect_name))
+    return SimpleNamespace(get_bind=lambda: bind)
+
+def compiled(condition):
+    return str(condition.compile(dialect=mysql.dialect(), compile_kwargs={"literal_binds": True}))
+
+def test_mysql_search_uses_fulltext_match():
+    sql = compiled(search_filter(bind_for("mysql"), "wireless headphones"))
+    assert "MATCH" in sql
+    assert "+wireless* +headphones*" in sql
+
+def test_stopwords_are_left_out_of_the_match():
+    sql = compiled(search_filter(bind_for("mysql"), "case with the phone"))
+    assert "+case* +phone*" in sql
+    assert "with" not in sql and "+the" not in sql
+
+def test_stopword_only_search_falls_back_to_like():
+    sql = compiled(search_filter(bind_for("mysql"), "the"))
+    assert "MATCH" not in sql
+    assert "LIKE" in sql and "the" in sql
+
+def test_short_words_fall_back_to_like():
+    sql = compiled(search_filter(bind_for("mysql"), "tv stand"))
+    assert "MATCH" not in sql
+    assert "LIKE" in sql
+
+def test_sqlite_always_uses_like():
+    sql = compiled(search_filter(bind_for("sqlite"), "headphones"))
+    assert "MATCH" not in sql
+    assert "LIKE" in sql
@@ -0,0 +1,61 @@
+"""
+Token user cache tests
+"""
+import pytest
+
+from app.core import security
+from app.core.security import create_access_token, invalidate_user, user_from_token
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    security._token_users.clear()
+    yield
+    security._token_users.clear()
+
+def rename(db, user, name):
+    user.name = name
+    db.commit()
+
+def test_lookup_is_cached_until_invalidated(db, customer):
+    token = create_access_token(customer.id, customer.role)
+    assert user_from_token(token, db)["name"] == "Asha"
+    
+    rename(db, customer, "Asha K")
+    assert user_from_token(token, db)["name"] == "Asha"
+    
+    invalidate_user(customer.id)
+    assert user_from_token(token, db)["name"] == "Asha K"
+
+def test_password_is_never_returned(db, customer):
+    token = create_access_token(customer.id, customer.role)
+    assert "password" not in user_from_token(token, db)
+    assert "password" not in user_from_token(token, db)
+
+def test_callers_cannot_mutate_the_cached_user(db, customer):
+    token = create_access_token(customer.id, customer.role)
+    
+    first = user_from_token(token, db)
+    first["addresses"].append({"line1": "Injected"})
+    first["name"] = "Changed"
+    
+    second = user_from_token(token, db)
+    assert second["addresses"] == []
+    assert second["name"] == "Asha"
+
+def test_admin_tokens_are_cached_briefly(db, customer, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now[0])
+    customer.role = "admin"
+    db.commit()
+    token = create_access_token(customer.id, customer.role)
+    user_from_token(token, db)
+    
+    rename(db, customer, "Asha K")
+    now[0] += security._ADMIN_TOKEN_TTL + 1
+    assert user_from_token(token, db)["name"] == "Asha K"
+
+def test_deleted_user_resolves_to_none(db, customer):
+    token = create_access_token(customer.id, customer.role)
+    db.delete(customer)
+    db.commit()
+    assert user_from_token(token, db) is None
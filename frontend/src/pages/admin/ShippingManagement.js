@@ -37,7 +37,7 @@ export default function ShippingManagement() {
 
   const fetchOrders = async () => {
     try {
-      const response = await ordersAPI.getAll({ limit: 100 });
+      const response = await ordersAPI.getAll();
 
       // The axios response has the data in response.data
       // The backend returns { orders: [...], total: ..., page: ..., limit: ... }
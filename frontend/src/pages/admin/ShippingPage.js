@@ -25,7 +25,7 @@ export default function ShippingPage() {
         setLoading(true);
         try {
             // Fetch all orders for now, filter client side or backend if supported
-            const response = await ordersAPI.getAll({ limit: 100 });
+            const response = await ordersAPI.getAll();
             setOrders(response.data.orders || []);
         } catch (error) {
             console.error('Failed to fetch orders:', error);